@@ -30,36 +30,34 @@ def build_pipeline(
         match_conditions.append({
             field: {
                 '$exists': True,
-                '$ne': None,
-                '$ne': ""
+                '$nin': [None, ""]
             }
         })
     
-    # Build expressions to count how many uncovered fields each document has
-    count_expressions = []
-    for field in uncovered_fields:
-        field_ref = self._get_field_reference(field)
-        count_expressions.append({
-            '$cond': [
-                {
+    # Build expression to count how many uncovered fields each document has:
+    # a single $filter over the list of field references, instead of one
+    # $cond per field summed with $add
+    field_refs = ['$' + field for field in uncovered_fields]
+    count_expression = {
+        '$size': {
+            '$filter': {
+                'input': field_refs,
+                'as': 'v',
+                'cond': {
                     '$and': [
-                        {'$ne': [field_ref, None]},
-                        {'$ne': [field_ref, ""]},
-                        {'$ne': [field_ref, []]}
+                        {'$ne': ['$$v', None]},
+                        {'$ne': ['$$v', ""]},
+                        {'$ne': ['$$v', []]}
                     ]
-                },
-                1,
-                0
-            ]
-        })
+                }
+            }
+        }
+    }
     
-    # Build projection to include all fields we need
-    # Group fields by their top-level parent (e.g., "MIFMP" from "MIFMP.BbkBic")
-    top_level_objects = set()
-    for field in uncovered_fields:
-        if '.' in field:
-            top_level = field.split('.')[0]
-            top_level_objects.add(top_level)
+    # Build projection to include only the leaf fields we need
+    # (e.g., "MIFMP.BbkBic" instead of the whole "MIFMP" object), so MongoDB
+    # doesn't ship every unused sub-field of wide payment documents
+    leaf_paths = sorted(set(field.replace('[]', '') for field in uncovered_fields))
     
     # Build project stage
     project_fields = {
@@ -67,16 +65,14 @@ def build_pipeline(
         'uncoveredFieldCount': 1   # Include the count we calculated
     }
     
-    # Include all top-level objects (like MIFMP, MsgFees, etc.)
-    for top_level in top_level_objects:
-        project_fields[top_level] = 1
+    for path in leaf_paths:
+        # Skip paths already included through a projected parent
+        # (MongoDB rejects "A" and "A.B" in the same projection)
+        if any(path.startswith(parent + '.') for parent in project_fields):
+            continue
+        project_fields[path] = 1
     
-    # Also include any non-nested uncovered fields
-    for field in uncovered_fields:
-        if '.' not in field:
-            project_fields[field] = 1
-    
-    logger.debug(f"Will project these top-level objects: {list(top_level_objects)}")
+    logger.debug(f"Will project these fields: {list(project_fields)}")
     
     # Build the pipeline
     pipeline = [
@@ -90,9 +86,7 @@ def build_pipeline(
         # Stage 2: Add field counting how many uncovered fields this record has
         {
             '$addFields': {
-                'uncoveredFieldCount': {
-                    '$add': count_expressions
-                }
+                'uncoveredFieldCount': count_expression
             }
         },
         
@@ -104,6 +98,9 @@ def build_pipeline(
         },
         
         # Stage 4: Sort by count (descending)
+        # $sort must be immediately followed by $limit so MongoDB can
+        # coalesce them into a bounded top-K sort instead of sorting
+        # every matched document
         {
             '$sort': {
                 'uncoveredFieldCount': -1
@@ -115,7 +112,7 @@ def build_pipeline(
             '$limit': limit
         },
         
-        # Stage 6: Project the fields we need (CRITICAL!)
+        # Stage 6: Project the fields we need (CRITICAL! must stay AFTER $limit)
         {
             '$project': project_fields
         }
@@ -66,7 +66,7 @@ def compare_field(
             java8_value = get_nested_value(java8_response, json_attribute)
 ```
 
-**Replace it with this:**
+**Replace it with this** (and add `get_nested_value_parts` to the imports from `.utils`: `from .utils import get_nested_value, get_nested_value_parts, deep_equal, safe_float_compare, is_numeric_string`):
 
 ```python
 def compare_field(
@@ -94,31 +94,36 @@ def compare_field(
     json_attribute = mapping['jsonAttribute']
     mongo_type = mapping.get('mongoType', 'Unknown')
     
-    mongo_value = get_nested_value(mongo_record, mongo_field)
+    # Paths are pre-split by config_loader; split here only for ad-hoc mappings
+    mongo_parts = mapping.get('_mongoParts') or tuple(mongo_field.replace('[]', '').split('.'))
+    json_parts = mapping.get('_jsonParts') or tuple(json_attribute.split('.'))
+    
+    mongo_value = get_nested_value_parts(mongo_record, mongo_parts)
     
     # Java 21 value extraction
     java21_value = None
     java21_error = None
     if java21_response is not None:
         # Check if it's an error response (has 'error' key but no 'data')
-        if isinstance(java21_response, dict) and 'error' in java21_response and 'success' in java21_response:
+        # (main.py hands over plain dicts only, so no per-field type check)
+        if 'error' in java21_response and 'success' in java21_response:
             if not java21_response['success']:
                 java21_error = java21_response.get('error', 'Unknown error')
         else:
             # It's actual response data, extract the field
-            java21_value = get_nested_value(java21_response, json_attribute)
+            java21_value = get_nested_value_parts(java21_response, json_parts)
     
     # Java 8 value extraction
     java8_value = None
     java8_error = None
     if java8_response is not None:
         # Check if it's an error response
-        if isinstance(java8_response, dict) and 'error' in java8_response and 'success' in java8_response:
+        if 'error' in java8_response and 'success' in java8_response:
             if not java8_response['success']:
                 java8_error = java8_response.get('error', 'Unknown error')
         else:
             # It's actual response data, extract the field
-            java8_value = get_nested_value(java8_response, json_attribute)
+            java8_value = get_nested_value_parts(java8_response, json_parts)
 ```
 
 ---
@@ -142,30 +147,31 @@ for mapping in self.mapping_config:
 **Replace with this:**
 
 ```python
-for mapping in self.mapping_config:
-    # Prepare responses for comparator
-    # If API call succeeded, pass the data; if failed, pass error dict
-    java21_data = None
-    if java21_result['success']:
-        java21_data = java21_result.get('data')
+# Prepare responses for comparator once per payment ID - the API outcome
+# is the same for every mapping, so don't rebuild it inside the loop.
+# If API call succeeded, pass the data; if failed, pass error dict
+java21_data = None
+if java21_result['success']:
+    java21_data = java21_result.get('data')
+else:
+    java21_data = {'success': False, 'error': java21_result.get('error', 'Unknown error')}
+
+java8_data = None
+if java8_result:
+    if java8_result['success']:
+        java8_data = java8_result.get('data')
     else:
-        # Pass error information
-        java21_data = {
-            'success': False,
-            'error': java21_result.get('error', 'Unknown error')
-        }
-    
-    java8_data = None
-    if java8_result:
-        if java8_result['success']:
-            java8_data = java8_result.get('data')
-        else:
-            # Pass error information
-            java8_data = {
-                'success': False,
-                'error': java8_result.get('error', 'Unknown error')
-            }
-    
+        java8_data = {'success': False, 'error': java8_result.get('error', 'Unknown error')}
+
+# The comparator relies on getting dicts - check that once here, not per
+# field, and turn any other payload (a list, a string) into an error outcome
+if java21_data is not None and not isinstance(java21_data, dict):
+    java21_data = {'success': False, 'error': f"Java 21 response is not a JSON object ({type(java21_data).__name__})"}
+
+if java8_data is not None and not isinstance(java8_data, dict):
+    java8_data = {'success': False, 'error': f"Java 8 response is not a JSON object ({type(java8_data).__name__})"}
+
+for mapping in self.mapping_config:
     field_result = self.comparator.compare_field(
         mongo_record=mongo_record,
         java21_response=java21_data,
@@ -193,14 +199,15 @@ mongo_type = mapping.get('mongoType', 'Unknown')
 mongo_value = get_nested_value(mongo_record, mongo_field)
 
 # DEBUG: Log what we're receiving
-logger.debug(f"\n--- Comparing field: {json_attribute} ---")
-logger.debug(f"Mongo field: {mongo_field}")
-logger.debug(f"Java21 response type: {type(java21_response)}")
+# (%-style args are only formatted when debug mode is on - this runs per field)
+logger.debug("\n--- Comparing field: %s ---", json_attribute)
+logger.debug("Mongo field: %s", mongo_field)
+logger.debug("Java21 response type: %s", type(java21_response))
 if java21_response:
-    logger.debug(f"Java21 response keys: {list(java21_response.keys()) if isinstance(java21_response, dict) else 'Not a dict'}")
-logger.debug(f"Java8 response type: {type(java8_response)}")
+    logger.debug("Java21 response keys: %s", java21_response.keys() if isinstance(java21_response, dict) else 'Not a dict')
+logger.debug("Java8 response type: %s", type(java8_response))
 if java8_response:
-    logger.debug(f"Java8 response keys: {list(java8_response.keys()) if isinstance(java8_response, dict) else 'Not a dict'}")
+    logger.debug("Java8 response keys: %s", java8_response.keys() if isinstance(java8_response, dict) else 'Not a dict')
 
 # Java 21 value extraction
 java21_value = None
@@ -248,21 +255,22 @@ java21_result = api_results['java21Result']
 java8_result = api_results['java8Result']
 
 # DEBUG: Show API response structure
-logger.debug(f"\n=== DEBUG: API Response Structure ===")
-logger.debug(f"Java 21 result keys: {list(java21_result.keys())}")
-logger.debug(f"Java 21 success: {java21_result.get('success')}")
-if java21_result.get('success') and java21_result.get('data'):
-    data_keys = list(java21_result['data'].keys())[:5]  # First 5 keys
-    logger.debug(f"Java 21 data top-level keys: {data_keys}")
-    logger.debug(f"Java 21 data type: {type(java21_result['data'])}")
-
-if java8_result:
-    logger.debug(f"Java 8 result keys: {list(java8_result.keys())}")
-    logger.debug(f"Java 8 success: {java8_result.get('success')}")
-    if java8_result.get('success') and java8_result.get('data'):
-        data_keys = list(java8_result['data'].keys())[:5]
-        logger.debug(f"Java 8 data top-level keys: {data_keys}")
-logger.debug(f"=====================================\n")
+if logger.debug_mode:
+    logger.debug("\n=== DEBUG: API Response Structure ===")
+    logger.debug("Java 21 result keys: %s", list(java21_result.keys()))
+    logger.debug("Java 21 success: %s", java21_result.get('success'))
+    if java21_result.get('success') and java21_result.get('data'):
+        data_keys = list(java21_result['data'].keys())[:5]  # First 5 keys
+        logger.debug("Java 21 data top-level keys: %s", data_keys)
+        logger.debug("Java 21 data type: %s", type(java21_result['data']))
+    
+    if java8_result:
+        logger.debug("Java 8 result keys: %s", list(java8_result.keys()))
+        logger.debug("Java 8 success: %s", java8_result.get('success'))
+        if java8_result.get('success') and java8_result.get('data'):
+            data_keys = list(java8_result['data'].keys())[:5]
+            logger.debug("Java 8 data top-level keys: %s", data_keys)
+    logger.debug("=====================================\n")
 ```
 
 ---
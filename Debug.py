@@ -211,11 +211,12 @@ for idx, stage in enumerate(pipeline, 1):
     stage_name = list(stage.keys())[0]
     logger.info(f"  Stage {idx}: {stage_name}")
 
-# Show the actual pipeline JSON
-logger.info("\n" + "="*70)
-logger.info("COMPLETE PIPELINE (for MongoDB testing):")
-logger.info("="*70)
-print(json.dumps(pipeline, indent=2, default=str))
+# Show the actual pipeline JSON (serializing it is not free - only in debug mode)
+if logger.debug_mode:
+    logger.debug("\n" + "="*70)
+    logger.debug("COMPLETE PIPELINE (for MongoDB testing):")
+    logger.debug("="*70)
+    print(json.dumps(pipeline, indent=2, default=str))
 
 # Connect to MongoDB
 logger.info("\n" + "="*70)
@@ -310,7 +311,7 @@ python debug_aggregation.py
 ```
 
 **This will show us:**
-1. The exact pipeline being generated
+1. The exact pipeline being generated (printed only when the logger is in debug mode)
 2. What MongoDB returns
 3. The structure of returned documents
 4. Whether field access works
@@ -335,7 +336,7 @@ Now let's test a simple aggregation in Compass:
 db.odsMPYPaymentDetail.aggregate([
   {
     $match: {
-      "MsgFees.FxRte": { $exists: true, $ne: null, $ne: "" }
+      "MsgFees.FxRte": { $exists: true, $nin: [null, ""] }
     }
   },
   {
@@ -344,14 +345,14 @@ db.odsMPYPaymentDetail.aggregate([
   {
     $project: {
       "_id": 1,
-      "MsgFees": 1,
-      "MIFMP": 1
+      "MsgFees.FxRte": 1,
+      "MIFMP.BbkBic": 1
     }
   }
 ])
 ```
 
-**What do you get?** Does it return the MIFMP and MsgFees objects?
+**What do you get?** Does it return `MIFMP` and `MsgFees` with just those leaf fields? (Projecting the dotted leaf paths, like the pipeline's `$project` stage does, keeps the rest of these large objects off the wire.)
 
 ---
 
@@ -77,6 +77,47 @@ Add `jsonResponseRootPath`:
 Replace the `get_nested_value` function:
 
 ```python
+import functools
+from typing import Any, Callable, Dict
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_accessor(path: str) -> Callable[[Any], Any]:
+    """
+    Build an accessor function for a dot path
+    
+    The path is split, and its numeric parts turned into array indexes, once -
+    mapping paths are fixed for the whole run, so a lookup only walks the
+    precompiled steps. Numeric parts only index lists and other parts only
+    key dicts; anything else along the path gives None.
+    """
+    steps = tuple(
+        (True, int(part)) if part.isdigit() else (False, part)
+        for part in path.split('.')
+    )
+    
+    def accessor(obj: Any) -> Any:
+        current = obj
+        
+        for is_index, key in steps:
+            # Numeric index (for arrays)
+            if is_index:
+                if isinstance(current, list) and key < len(current):
+                    current = current[key]
+                else:
+                    return None
+            
+            # Regular key access
+            elif isinstance(current, dict) and key in current:
+                current = current[key]
+            else:
+                return None
+        
+        return current
+    
+    return accessor
+
+
 def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
     """
     Get value from nested dictionary using dot notation with array index support
@@ -100,34 +141,18 @@ def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
     if not obj or not path:
         return None
     
-    parts = path.split('.')
-    current = obj
-    
-    for part in parts:
-        if current is None:
-            return None
-        
-        # Check if part is a numeric index (for arrays)
-        if part.isdigit():
-            index = int(part)
-            if isinstance(current, list):
-                if 0 <= index < len(current):
-                    current = current[index]
-                else:
-                    return None
-            else:
-                return None
-        
-        # Regular key access
-        elif isinstance(current, dict):
-            if part in current:
-                current = current[part]
-            else:
-                return None
-        else:
-            return None
-    
-    return current
+    return compile_accessor(path)(obj)
+```
+
+### **Update src/config_loader.py**
+
+Compile each mapping's paths once when the mapping config is loaded. Add this at the end of `load_mapping_config`, before `return mapping_config` (and add `compile_accessor` to the `.utils` import):
+
+```python
+# Compile field paths once, so comparisons don't re-parse them per record
+for mapping in mapping_config:
+    mapping['_mongoAccessor'] = compile_accessor(mapping['mongoField'])
+    mapping['_jsonAccessor'] = compile_accessor(mapping['jsonAttribute'])
 ```
 
 ---
@@ -136,16 +161,22 @@ def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
 
 ### **Update src/comparator.py**
 
-Modify the `compare_field` method to apply root path:
+Modify the `compare_field` method to take the response data already resolved to the root path, and add a sentinel for callers that don't pass it above the `Comparator` class:
 
 ```python
+# Default for the root arguments - callers that don't resolve the root path
+# themselves are compared against the whole response, as before
+_ROOT_NOT_GIVEN = object()
+
+
 def compare_field(
     self,
     mongo_record: Dict[str, Any],
     java21_response: Optional[Dict[str, Any]],
     java8_response: Optional[Dict[str, Any]],
     mapping: Dict[str, str],
-    json_root_path: Optional[str] = None  # ADD THIS PARAMETER
+    java21_root: Any = _ROOT_NOT_GIVEN,  # ADD THESE PARAMETERS
+    java8_root: Any = _ROOT_NOT_GIVEN
 ) -> Dict[str, Any]:
     """
     Compare a single field across MongoDB and API responses
@@ -155,7 +186,10 @@ def compare_field(
         java21_response: Java 21 API response
         java8_response: Java 8 API response (optional)
         mapping: Field mapping dict
-        json_root_path: Root path to navigate to actual data (e.g., "data.attributes.paymentDetails.0")
+        java21_root: Java 21 response data at the root path (defaults to
+            java21_response)
+        java8_root: Java 8 response data at the root path (defaults to
+            java8_response)
     
     Returns:
         Dict with comparison results
@@ -166,7 +200,11 @@ def compare_field(
     json_attribute = mapping['jsonAttribute']
     mongo_type = mapping.get('mongoType', 'Unknown')
     
-    mongo_value = get_nested_value(mongo_record, mongo_field)
+    # Accessors are compiled by config_loader; compile here only for ad-hoc mappings
+    mongo_accessor = mapping.get('_mongoAccessor') or compile_accessor(mongo_field)
+    json_accessor = mapping.get('_jsonAccessor') or compile_accessor(json_attribute)
+    
+    mongo_value = mongo_accessor(mongo_record)
     
     java21_value = None
     java21_error = None
@@ -174,15 +212,11 @@ def compare_field(
         if 'success' in java21_response and not java21_response['success']:
             java21_error = java21_response.get('error', 'Unknown error')
         else:
-            # Apply root path if provided
-            response_data = java21_response
-            if json_root_path:
-                response_data = get_nested_value(java21_response, json_root_path)
-                if response_data is None:
-                    java21_error = f"Could not navigate to root path: {json_root_path}"
-            
-            if response_data and not java21_error:
-                java21_value = get_nested_value(response_data, json_attribute)
+            # Root path was resolved once per payment ID by the caller (a missing
+            # root arrives as an error response, handled above)
+            if java21_root is _ROOT_NOT_GIVEN:
+                java21_root = java21_response
+            java21_value = json_accessor(java21_root)
     
     java8_value = None
     java8_error = None
@@ -190,15 +224,11 @@ def compare_field(
         if 'success' in java8_response and not java8_response['success']:
             java8_error = java8_response.get('error', 'Unknown error')
         else:
-            # Apply root path if provided
-            response_data = java8_response
-            if json_root_path:
-                response_data = get_nested_value(java8_response, json_root_path)
-                if response_data is None:
-                    java8_error = f"Could not navigate to root path: {json_root_path}"
-            
-            if response_data and not java8_error:
-                java8_value = get_nested_value(response_data, json_attribute)
+            # Root path was resolved once per payment ID by the caller (a missing
+            # root arrives as an error response, handled above)
+            if java8_root is _ROOT_NOT_GIVEN:
+                java8_root = java8_response
+            java8_value = json_accessor(java8_root)
     
     # Rest of the method stays the same...
     mongo_vs_java21 = self._compare_values(
@@ -246,7 +276,7 @@ def compare_field(
 
 ### **Update src/main.py**
 
-In the `_test_single_payment_id` method, pass the root path to comparator:
+In the `_test_single_payment_id` method, resolve the root path once per payment ID (it is the same for every mapping) and pass the result to the comparator:
 
 Find this section:
 ```python
@@ -262,7 +292,7 @@ for mapping in self.mapping_config:
     )
 ```
 
-**Replace with:**
+**Replace with** (and add `from .utils import get_nested_value` to the imports):
 ```python
 # Step 3: Compare all fields
 logger.debug("Comparing fields...")
@@ -270,13 +300,34 @@ logger.debug("Comparing fields...")
 # Get root path from config if exists
 json_root_path = self.test_config.get('jsonResponseRootPath')
 
+java21_response = java21_result.get('data') if java21_result['success'] else java21_result
+java8_response = java8_result.get('data') if java8_result and java8_result['success'] else java8_result
+
+# Navigate to the root path once here, not once per mapping. If it's missing,
+# hand the comparator an error response so every field reports it without
+# attempting any lookups
+java21_root = java21_response
+if json_root_path and java21_result['success']:
+    java21_root = get_nested_value(java21_response, json_root_path)
+    if java21_root is None:
+        logger.warn(f"Could not navigate Java 21 response to root path: {json_root_path}")
+        java21_response = {'success': False, 'error': f"Could not navigate to root path: {json_root_path}"}
+
+java8_root = java8_response
+if json_root_path and java8_result and java8_result['success']:
+    java8_root = get_nested_value(java8_response, json_root_path)
+    if java8_root is None:
+        logger.warn(f"Could not navigate Java 8 response to root path: {json_root_path}")
+        java8_response = {'success': False, 'error': f"Could not navigate to root path: {json_root_path}"}
+
 for mapping in self.mapping_config:
     field_result = self.comparator.compare_field(
         mongo_record=mongo_record,
-        java21_response=java21_result.get('data') if java21_result['success'] else java21_result,
-        java8_response=java8_result.get('data') if java8_result and java8_result['success'] else java8_result,
+        java21_response=java21_response,
+        java8_response=java8_response,
         mapping=mapping,
-        json_root_path=json_root_path  # ADD THIS
+        java21_root=java21_root,  # ADD THESE
+        java8_root=java8_root
     )
 ```
 
@@ -423,10 +474,11 @@ all_passed &= test_array_index_in_path()
 ## Summary of Changes
 
 1. **Test Config**: Added `"jsonResponseRootPath": "data.attributes.paymentDetails.0"`
-2. **Utils**: Updated `get_nested_value()` to handle numeric indices
-3. **Comparator**: Added `json_root_path` parameter and logic to navigate to root first
-4. **Main**: Pass root path from config to comparator
-5. **Mapping Config**: Simplified paths (removed `paymentDetails.` prefix)
+2. **Utils**: Updated `get_nested_value()` to handle numeric indices, compiling each path once
+3. **Config Loader**: Attach compiled `_mongoAccessor` / `_jsonAccessor` to each mapping
+4. **Comparator**: Added optional `java21_root` / `java8_root` parameters holding the response data at the root path (defaulting to the whole response)
+5. **Main**: Resolve the root path from config once per payment ID and pass it to comparator
+6. **Mapping Config**: Simplified paths (removed `paymentDetails.` prefix)
 
 ---
 
@@ -90,15 +90,16 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
             if attempt > 0:
                 _log('debug', f"  Attempt {attempt + 1}/{max_attempts} - previous payment ID didn't match regex")
             
-            # Execute query
-            documents = list(self.collection.find(query, projection).skip(attempt).limit(1))
+            # Execute query - limit(1) returns at most one document, so take
+            # it straight off the cursor instead of building a list
+            cursor = self.collection.find(query, projection).skip(attempt).limit(1)
+            document = next(cursor, None)
+            cursor.close()
             
-            if not documents:
+            if document is None:
                 _log('debug', f"  ✗ No more documents found")
                 return None
             
-            document = documents[0]
-            
             if payment_id_field in document:
                 payment_id = document[payment_id_field]
                 
@@ -167,18 +168,45 @@ query = {
 
 ## UPDATE: Complete Fixed Method
 
-Replace the `find_one_with_field` method with this version:
+Replace the `find_one_with_field` method with this version (and add `import functools` and `import re` to the imports at the top of `src/mongo_client.py`). In `run_phase_2`, pass the mapping's `_cleanedField` (its path with `[]` notation already removed by config_loader) when it has one: `mapping.get('_cleanedField') or mapping['mongoField']`. Any `[]` left in the path is still stripped here.
+
+Phase 2 calls it once per uncovered attribute, nearly always with the same validation regex, so add this module-level helper (below the imports) to compile each pattern only once per run:
 
 ```python
-def find_one_with_field(self, field_name: str, payment_id_field: str, validation_regex: str = None) -> Optional[str]:
+@functools.lru_cache(maxsize=128)
+def _compiled_regex(pattern: str) -> re.Pattern:
+    """Compile a payment ID validation regex, once per distinct pattern"""
+    return re.compile(pattern)
+```
+
+Next to the module's `_log` helper, add a check for debug output that also works before the logger is initialized:
+
+```python
+def _debug_enabled() -> bool:
+    """Whether debug output is on (False until init_logger has run)"""
+    return getattr(logger, 'debug_mode', False)
+```
+
+```python
+def find_one_with_field(
+    self,
+    field_name: str,
+    payment_id_field: str,
+    validation_regex: str = None,
+    sample: bool = False
+) -> Optional[str]:
     """
     Find ONE document that has the specified field with non-null, non-empty value
     Used in Phase 2 to find payment IDs for uncovered attributes
     
     Args:
-        field_name: MongoDB field name to search for
+        field_name: MongoDB field name to search for ([] array notation
+            is stripped; the mapping's '_cleanedField' has none)
         payment_id_field: Payment ID field name to extract
         validation_regex: Optional regex pattern to validate payment ID format
+        sample: Pick random candidates ($sample) instead of the first ones in
+            collection order - spreads Phase 2 over more varied records, but
+            MongoDB has to read every matching document to sample them
     
     Returns:
         Payment ID if found and valid, None otherwise
@@ -188,9 +216,8 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
         return None
     
     try:
-        import re
-        
-        # Clean array notation from field name
+        # Clean array notation from field name (a no-op for '_cleanedField'
+        # paths, stripped when the mapping config was loaded)
         cleaned_field = field_name.replace('[]', '')
         
         # Build query - robust null/empty checking
@@ -206,28 +233,36 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
         # Project only payment ID field
         projection = {payment_id_field: 1}
         
-        # DEBUG: Log the query
-        _log('debug', f"Searching for document with field: {cleaned_field}")
-        _log('debug', f"  Collection: {self.collection_name}")
-        _log('debug', f"  Query (excluding nulls, empty strings, empty arrays)")
-        _log('debug', f"  Validation regex: {validation_regex if validation_regex else 'None'}")
+        # DEBUG: Log the query (only build these lines when debug output is
+        # on - this runs once per uncovered field)
+        debug = _debug_enabled()
+        if debug:
+            _log('debug', f"Searching for document with field: {cleaned_field}")
+            _log('debug', f"  Collection: {self.collection_name}")
+            _log('debug', f"  Query (excluding nulls, empty strings, empty arrays)")
+            _log('debug', f"  Validation regex: {validation_regex if validation_regex else 'None'}")
         
         # If we have a validation regex, we might need to try multiple documents
         max_attempts = 10 if validation_regex else 1
+        pattern = _compiled_regex(validation_regex) if validation_regex else None
         
-        for attempt in range(max_attempts):
-            if attempt > 0:
+        # One query walking up to max_attempts candidates - skip(N) per
+        # attempt made the server re-scan the first N matches every time
+        if sample:
+            cursor = self.collection.aggregate([
+                {'$match': query},
+                {'$sample': {'size': max_attempts}},
+                {'$project': projection}
+            ])
+        else:
+            cursor = self.collection.find(query, projection).limit(max_attempts)
+        
+        found_any = False
+        for attempt, document in enumerate(cursor):
+            found_any = True
+            if attempt > 0 and debug:
                 _log('debug', f"  Attempt {attempt + 1}/{max_attempts}")
             
-            # Execute query
-            documents = list(self.collection.find(query, projection).skip(attempt).limit(1))
-            
-            if not documents:
-                _log('debug', f"  ✗ No document found with non-null value for {cleaned_field}")
-                return None
-            
-            document = documents[0]
-            
             if payment_id_field in document:
                 payment_id = document[payment_id_field]
                 
@@ -235,18 +270,25 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
                 if payment_id_field == '_id' and hasattr(payment_id, '__str__'):
                     payment_id = str(payment_id)
                 
-                # Validate against regex if provided
-                if validation_regex:
-                    if re.match(validation_regex, str(payment_id)):
+                # Validate against regex if provided - client-side, since a
+                # MongoDB $regex only matches strings and would drop ObjectId
+                # or numeric payment IDs before str() could be applied
+                if pattern:
+                    if pattern.match(str(payment_id)):
                         _log('debug', f"  ✓ Found valid payment ID: {payment_id}")
                         return payment_id
                     else:
-                        _log('debug', f"  ✗ Payment ID {payment_id} doesn't match regex, trying next...")
+                        if debug:
+                            _log('debug', f"  ✗ Payment ID {payment_id} doesn't match regex, trying next...")
                         continue
                 else:
                     _log('debug', f"  ✓ Found payment ID: {payment_id}")
                     return payment_id
         
+        if not found_any:
+            _log('debug', f"  ✗ No document found with non-null value for {cleaned_field}")
+            return None
+        
         _log('debug', f"  ✗ No valid payment ID found after {max_attempts} attempts")
         return None
         
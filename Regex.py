@@ -37,9 +37,23 @@ Add a regex pattern for payment ID validation:
 }
 ```
 
+If payment IDs come in more than one format, `validationRegex` can also be a list of patterns - an ID is valid when it matches any of them:
+
+```json
+"validationRegex": ["^[0-9]{16}$", "^PCTA[0-9A-Z]{8}$"]
+```
+
 ### **Step 2: Update src/mongo_client.py**
 
-Add regex validation to `find_one_with_field` method:
+Next to the module's `_log` helper, add a check for debug output that also works before the logger is initialized:
+
+```python
+def _debug_enabled() -> bool:
+    """Whether debug output is on (False until init_logger has run)"""
+    return getattr(logger, 'debug_mode', False)
+```
+
+Add regex validation to `find_one_with_field` method (and add `import re` to the imports at the top of `src/mongo_client.py`):
 
 ```python
 def find_one_with_field(self, field_name: str, payment_id_field: str, validation_regex: str = None) -> Optional[str]:
@@ -60,8 +74,6 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
         return None
     
     try:
-        import re
-        
         # Clean array notation from field name
         cleaned_field = field_name.replace('[]', '')
         
@@ -69,56 +81,77 @@ def find_one_with_field(self, field_name: str, payment_id_field: str, validation
         query = {
             cleaned_field: {
                 '$exists': True,
-                '$ne': None,
-                '$ne': ""
+                '$nin': [None, ""]
             }
         }
         
+        # Let MongoDB drop string payment IDs that can't match the format, so
+        # they don't use up attempts - $regex only matches strings, so IDs of
+        # other types (ObjectId, numbers) are kept for the str() check below
+        if validation_regex:
+            query = {
+                **query,
+                '$or': [
+                    {payment_id_field: {'$regex': validation_regex}},
+                    {payment_id_field: {'$not': {'$type': 'string'}}}
+                ]
+            }
+        
         # Project only payment ID field
         projection = {payment_id_field: 1}
         
-        # DEBUG: Log the query
-        _log('debug', f"Searching for document with field: {cleaned_field}")
-        _log('debug', f"  Collection: {self.collection_name}")
-        _log('debug', f"  Query: {query}")
-        _log('debug', f"  Validation regex: {validation_regex if validation_regex else 'None'}")
+        # DEBUG: Log the query (formatting the query dict isn't free, so only
+        # build these lines when debug output is on - this runs per uncovered field)
+        debug = _debug_enabled()
+        if debug:
+            _log('debug', f"Searching for document with field: {cleaned_field}")
+            _log('debug', f"  Collection: {self.collection_name}")
+            _log('debug', f"  Query: {query}")
+            _log('debug', f"  Validation regex: {validation_regex if validation_regex else 'None'}")
         
         # If we have a validation regex, we might need to try multiple documents
         max_attempts = 10 if validation_regex else 1
         
-        for attempt in range(max_attempts):
-            # Skip documents we've already checked
-            if attempt > 0:
-                _log('debug', f"  Attempt {attempt + 1}/{max_attempts} - previous payment ID didn't match regex")
-            
-            # Execute query
-            documents = list(self.collection.find(query, projection).skip(attempt).limit(1))
-            
-            if not documents:
-                _log('debug', f"  ✗ No more documents found")
-                return None
-            
-            document = documents[0]
-            
-            if payment_id_field in document:
-                payment_id = document[payment_id_field]
-                
-                # Convert ObjectId to string if it's _id
-                if payment_id_field == '_id' and hasattr(payment_id, '__str__'):
-                    payment_id = str(payment_id)
+        # Compile the pattern once up front rather than on every attempt
+        pattern = re.compile(validation_regex) if validation_regex else None
+        
+        # One query streaming up to max_attempts candidates in a single batch,
+        # instead of a new skip(N) query (and index re-walk) per attempt
+        cursor = self.collection.find(query, projection).limit(max_attempts).batch_size(max_attempts)
+        
+        try:
+            found_any = False
+            for attempt, document in enumerate(cursor):
+                found_any = True
+                if attempt > 0 and debug:
+                    _log('debug', f"  Attempt {attempt + 1}/{max_attempts} - previous payment ID didn't match regex")
                 
-                # Validate against regex if provided
-                if validation_regex:
-                    if re.match(validation_regex, str(payment_id)):
-                        _log('debug', f"  ✓ Found valid payment ID: {payment_id} (matches regex)")
-                        return payment_id
+                if payment_id_field in document:
+                    payment_id = document[payment_id_field]
+                    
+                    # Convert ObjectId to string if it's _id
+                    if payment_id_field == '_id' and hasattr(payment_id, '__str__'):
+                        payment_id = str(payment_id)
+                    
+                    # Validate against regex if provided
+                    if pattern:
+                        if pattern.match(str(payment_id)):
+                            _log('debug', f"  ✓ Found valid payment ID: {payment_id} (matches regex)")
+                            return payment_id
+                        else:
+                            if debug:
+                                _log('debug', f"  ✗ Payment ID {payment_id} doesn't match regex pattern")
+                            continue  # Try next document
                     else:
-                        _log('debug', f"  ✗ Payment ID {payment_id} doesn't match regex pattern")
-                        continue  # Try next document
-                else:
-                    # No validation needed
-                    _log('debug', f"  ✓ Found payment ID: {payment_id}")
-                    return payment_id
+                        # No validation needed
+                        _log('debug', f"  ✓ Found payment ID: {payment_id}")
+                        return payment_id
+        finally:
+            cursor.close()
+        
+        if not found_any:
+            _log('debug', f"  ✗ No more documents found")
+            return None
         
         # If we exhausted all attempts
         _log('debug', f"  ✗ No valid payment ID found after {max_attempts} attempts")
@@ -148,34 +181,42 @@ def run_phase_2(self):
     self.logger.info(f"{len(uncovered_mappings)} attributes not yet covered")
     self.logger.info("Searching for payment IDs with these attributes...\n")
     
-    # Find payment IDs for uncovered attributes
-    payment_ids_to_test: Set[str] = set()
     payment_id_field = self.test_config['paymentIdMapping']['mongoField']
     
     # Get validation regex from config (optional)
     validation_regex = self.test_config['paymentIdMapping'].get('validationRegex')
     
+    # A list of accepted formats becomes one alternation, so each payment ID
+    # is checked with a single match (in Python and in MongoDB's $regex)
+    if isinstance(validation_regex, list):
+        validation_regex = '|'.join(f'(?:{p})' for p in validation_regex) or None
+    
     if validation_regex:
         self.logger.debug(f"Payment ID validation regex: {validation_regex}")
     
+    # Find one payment ID per uncovered field (with regex validation), so
+    # every field with data somewhere in the collection gets tested - a dict
+    # keeps the payment IDs in the order they were found
     self.logger.info("Querying MongoDB for uncovered attributes...")
     
+    payment_ids_to_test: Dict[str, None] = {}
+    
     for idx, mapping in enumerate(uncovered_mappings, 1):
-        mongo_field = mapping['mongoField']
         json_attr = mapping['jsonAttribute']
         
         self.logger.debug(f"[{idx}/{len(uncovered_mappings)}] {json_attr}")
         
-        # Find payment ID with this field (with regex validation)
+        # Array notation is stripped once by config_loader; strip it here
+        # only for mappings that didn't come through it
         payment_id = self.mongo_client.find_one_with_field(
-            mongo_field, 
+            mapping.get('_cleanedField') or mapping['mongoField'].replace('[]', ''),
             payment_id_field,
             validation_regex  # Pass regex for validation
         )
         
         if payment_id:
             if payment_id not in payment_ids_to_test:
-                payment_ids_to_test.add(payment_id)
+                payment_ids_to_test[payment_id] = None
                 self.logger.debug(f"  → Added {payment_id} to test queue")
             else:
                 self.logger.debug(f"  → {payment_id} already in queue")
@@ -211,20 +252,67 @@ Response Parser Module
 Extracts all attributes from API response
 """
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterator, Tuple
 from .logger import logger
 
 
 class ResponseParser:
     """Parses API responses to extract all attribute paths"""
     
+    def _iter_leaves(self, response: Any, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+        """
+        Walk the response and yield (attribute path, value) for every leaf
+        
+        Uses an explicit stack of dict iterators instead of recursion, so a
+        nested object costs a stack push rather than a Python call. Leaves
+        come out in the same order as a depth-first recursive walk.
+        
+        Args:
+            response: API response (dict or list)
+            prefix: Path prefix for the top-level keys
+        
+        Yields:
+            Tuples of (path in dot notation with [] for arrays, value)
+        """
+        # A top-level list is described by its first element
+        while isinstance(response, list):
+            if not response:
+                return
+            response = response[0]
+        
+        if not isinstance(response, dict):
+            return
+        
+        stack = [(iter(response.items()), prefix)]
+        
+        while stack:
+            items, path_prefix = stack[-1]
+            
+            for key, value in items:
+                current_path = f"{path_prefix}.{key}" if path_prefix else key
+                
+                if isinstance(value, dict):
+                    # Descend into nested dict; resume this one afterwards
+                    stack.append((iter(value.items()), current_path))
+                    break
+                elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
+                    # Array of objects - add [] and describe it by its first element
+                    stack.append((iter(value[0].items()), f"{current_path}[]"))
+                    break
+                else:
+                    # Primitive value, list of primitives or empty list
+                    yield current_path, value
+            else:
+                # This dict is exhausted
+                stack.pop()
+    
     def extract_all_attributes(self, response: Any, prefix: str = '') -> List[str]:
         """
-        Recursively extract all attribute paths from response
+        Extract all attribute paths from response
         
         Args:
             response: API response (dict or list)
-            prefix: Current path prefix for recursion
+            prefix: Current path prefix
         
         Returns:
             List of all attribute paths in dot notation (with [] for arrays)
@@ -233,36 +321,7 @@ class ResponseParser:
             Input: {"user": {"name": "John"}, "items": [{"id": 1}]}
             Output: ["user.name", "items[].id"]
         """
-        attributes = []
-        
-        if isinstance(response, dict):
-            for key, value in response.items():
-                current_path = f"{prefix}.{key}" if prefix else key
-                
-                if isinstance(value, dict):
-                    # Recurse into nested dict
-                    attributes.extend(self.extract_all_attributes(value, current_path))
-                elif isinstance(value, list):
-                    # Handle list - add [] notation and extract from first element
-                    if len(value) > 0 and isinstance(value[0], dict):
-                        # Add [] to indicate array
-                        array_path = f"{current_path}[]"
-                        # Extract attributes from first element with [] prefix
-                        child_attrs = self.extract_all_attributes(value[0], array_path)
-                        attributes.extend(child_attrs)
-                    else:
-                        # List of primitives or empty list
-                        attributes.append(current_path)
-                else:
-                    # Primitive value
-                    attributes.append(current_path)
-        
-        elif isinstance(response, list):
-            # Top-level list - extract from first element
-            if len(response) > 0:
-                attributes.extend(self.extract_all_attributes(response[0], prefix))
-        
-        return attributes
+        return [path for path, _ in self._iter_leaves(response, prefix)]
     
     def extract_attributes_with_values(self, response: Any, prefix: str = '') -> Dict[str, Any]:
         """
@@ -275,31 +334,30 @@ class ResponseParser:
         Returns:
             Dict mapping attribute paths to values
         """
-        result = {}
-        
-        if isinstance(response, dict):
-            for key, value in response.items():
-                current_path = f"{prefix}.{key}" if prefix else key
-                
-                if isinstance(value, dict):
-                    result.update(self.extract_attributes_with_values(value, current_path))
-                elif isinstance(value, list):
-                    if len(value) > 0 and isinstance(value[0], dict):
-                        array_path = f"{current_path}[]"
-                        result.update(self.extract_attributes_with_values(value[0], array_path))
-                    else:
-                        result[current_path] = value
-                else:
-                    result[current_path] = value
-        
-        return result
+        return dict(self._iter_leaves(response, prefix))
 ```
 
 ### **Step 5: Update src/main.py - test_single_payment_id method**
 
-Now the response parser returns `messages[].amount`, which will match the mapping `messages[].amount`:
+Now the response parser returns `messages[].amount`, which will match the mapping `messages[].amount`.
+
+The `[]`-free MongoDB paths only depend on the mapping, so strip them once in `load_configurations`, right after `self.json_to_mongo_map` is built (and set it to `None` in `__init__`):
 
 ```python
+# MongoDB paths without [] notation for get_nested_value, keyed by JSON
+# attribute - stripped once here rather than per attribute for every payment ID
+self.mongo_field_stripped = {attr: field.replace('[]', '') for attr, field in self.json_to_mongo_map.items()}
+```
+
+The parser's keys now match the mapping, so flatten each API response once with `extract_attributes_with_values` and read the values straight out of those dicts, instead of walking the response from the root for every attribute:
+
+```python
+# In test_single_payment_id method, in Step 5:
+
+java21_values = self.response_parser.extract_attributes_with_values(java21_response)
+java8_values = self.response_parser.extract_attributes_with_values(java8_response) if java8_response else {}
+response_attributes = list(java21_values)
+
 # In test_single_payment_id method, in Step 6:
 
 for attribute in response_attributes:
@@ -312,12 +370,9 @@ for attribute in response_attributes:
         continue
     
     # Get values from all sources
-    # For response attributes, remove [] for value extraction
-    attribute_for_extraction = attribute.replace('[]', '')
-    
-    mongo_value = get_nested_value(mongo_doc, mongo_field.replace('[]', ''))
-    java21_value = get_nested_value(java21_response, attribute_for_extraction)
-    java8_value = get_nested_value(java8_response, attribute_for_extraction) if java8_response else None
+    mongo_value = get_nested_value(mongo_doc, self.mongo_field_stripped[attribute])
+    java21_value = java21_values[attribute]
+    java8_value = java8_values.get(attribute)
     
     # ... rest stays the same
 ```
@@ -327,7 +382,7 @@ for attribute in response_attributes:
 ## SUMMARY OF CHANGES
 
 **Config (test-sample.json):**
-- Added `validationRegex` to `paymentIdMapping`
+- Added `validationRegex` to `paymentIdMapping` (one pattern, or a list of accepted patterns)
 
 **mongo_client.py:**
 - Added `validation_regex` parameter to `find_one_with_field`
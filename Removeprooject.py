@@ -70,13 +70,91 @@ When MongoDB processes `$addFields` with nested field references like `$MIFMP.Db
 
 ---
 
-## Solution: Remove $project Stage Completely
+## Solution: Move $project to the Very End
 
-Let's just NOT project anything and return the full documents. MongoDB will include all fields by default.
+Let every stage that looks at the uncovered fields work on the full documents, and only project once the candidates are chosen - the last stage, after $sort and $limit.
 
 ### **Update src/aggregation_builder.py - build_pipeline method**
 
-Replace the entire `build_pipeline` method with this simpler version:
+The per-field `$match` condition and `$cond` counter only depend on the field name, so build them once per field and reuse them on later Phase 2 passes (the `_field_fragments` cache below).
+
+MongoDB can only answer the `$or` in Stage 1 with index scans when **every** branch has an index - a single unindexed field turns the whole `$match` into a collection scan. So the builder also takes the list of indexed (ideally sparse-indexed) fields from the test config, to report which uncovered fields force that scan. Change `__init__` to:
+
+```python
+def __init__(self, payment_id_field: str, indexed_fields: Optional[List[str]] = None):
+    """
+    Initialize aggregation builder
+    
+    Args:
+        payment_id_field: MongoDB field name for payment ID
+        indexed_fields: MongoDB fields that have an index (optional) - used
+            to report which uncovered fields force a collection scan
+    """
+    self.payment_id_field = payment_id_field
+    self.indexed_fields = set(f.replace('[]', '') for f in indexed_fields) if indexed_fields else None
+    
+    # Per-field pipeline fragments, keyed by raw mongoField:
+    # (cleaned field, $match condition, $cond counter)
+    self._field_fragments: Dict[str, Tuple[str, Dict[str, Any], Dict[str, Any]]] = {}
+```
+
+and pass the optional `indexedFields` list from `configs/test-sample.json` where it's created in `main.py`:
+
+```python
+self.aggregation_builder = AggregationBuilder(
+    payment_id_mongo_field,
+    indexed_fields=self.test_config.get('indexedFields')
+)
+```
+
+(add `Optional` and `Tuple` to the `typing` import), then add this helper next to `_get_field_reference`:
+
+```python
+def _get_field_fragments(self, mongo_field: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """
+    Get the cleaned name, $match condition and $cond counter for a field
+    
+    Built on first use and cached, so repeated pipelines skip the string work.
+    
+    Args:
+        mongo_field: MongoDB field name from the mapping (may contain [])
+    
+    Returns:
+        Tuple of (cleaned field, match condition, count expression)
+    """
+    fragments = self._field_fragments.get(mongo_field)
+    
+    if fragments is None:
+        cleaned_field = mongo_field.replace('[]', '')
+        field_ref = self._get_field_reference(cleaned_field)
+        
+        match_condition = {
+            cleaned_field: {
+                '$exists': True,
+                '$nin': [None, ""]
+            }
+        }
+        count_expression = {
+            '$cond': [
+                {
+                    '$and': [
+                        {'$ne': [field_ref, None]},
+                        {'$ne': [field_ref, ""]},
+                        {'$ne': [field_ref, []]}
+                    ]
+                },
+                1,
+                0
+            ]
+        }
+        
+        fragments = (cleaned_field, match_condition, count_expression)
+        self._field_fragments[mongo_field] = fragments
+    
+    return fragments
+```
+
+Then replace the entire `build_pipeline` method with this simpler version:
 
 ```python
 def build_pipeline(
@@ -97,46 +175,35 @@ def build_pipeline(
     if not uncovered_mappings:
         return []
     
-    # Clean array notation from field names
-    uncovered_fields = []
-    for m in uncovered_mappings:
-        field = m['mongoField']
-        cleaned_field = field.replace('[]', '')
-        uncovered_fields.append(cleaned_field)
+    fragments = [self._get_field_fragments(m['mongoField']) for m in uncovered_mappings]
+    
+    # Cleaned field names (array notation removed)
+    uncovered_fields = [cleaned_field for cleaned_field, _, _ in fragments]
     
     logger.debug(f"Building aggregation for {len(uncovered_fields)} uncovered fields")
     logger.debug(f"Sample cleaned fields: {uncovered_fields[:3]}")
     
-    # Build $or conditions for $match stage
-    match_conditions = []
-    for field in uncovered_fields:
-        match_conditions.append({
-            field: {
-                '$exists': True,
-                '$ne': None,
-                '$ne': ""
-            }
-        })
+    # $or conditions for $match stage
+    match_conditions = [match_condition for _, match_condition, _ in fragments]
     
-    # Build expressions to count how many uncovered fields each document has
-    count_expressions = []
-    for field in uncovered_fields:
-        field_ref = self._get_field_reference(field)
-        count_expressions.append({
-            '$cond': [
-                {
-                    '$and': [
-                        {'$ne': [field_ref, None]},
-                        {'$ne': [field_ref, ""]},
-                        {'$ne': [field_ref, []]}
-                    ]
-                },
-                1,
-                0
-            ]
-        })
+    # An $or can only use indexes if every branch is indexed - name the
+    # fields that make MongoDB scan the whole collection instead
+    if self.indexed_fields is not None:
+        unindexed_fields = [field for field in uncovered_fields if field not in self.indexed_fields]
+        if unindexed_fields:
+            logger.warn(f"{len(unindexed_fields)} uncovered fields have no index - $match will scan the collection")
+            logger.debug(f"Unindexed fields: {unindexed_fields[:10]}")
+    
+    # Expressions to count how many uncovered fields each document has
+    count_expressions = [count_expression for _, _, count_expression in fragments]
+    
+    # Whole top-level objects (payment ID + those holding uncovered fields),
+    # so projecting "MIFMP" never collides with "MIFMP.DbAccNo"
+    top_level_fields = {field.split('.', 1)[0] for field in [self.payment_id_field] + uncovered_fields}
+    project_fields = {name: 1 for name in sorted(top_level_fields)}
+    project_fields['uncoveredFieldCount'] = 1
     
-    # Build the pipeline WITHOUT $project stage
+    # Build the pipeline with $project as the very last stage
     pipeline = [
         # Stage 1: Match records with ANY uncovered field
         {
@@ -170,26 +237,103 @@ def build_pipeline(
         # Stage 5: Limit to top candidates
         {
             '$limit': limit
-        }
+        },
         
-        # NO STAGE 6 - Just return full documents!
+        # Stage 6: Project the top-level objects we read from each candidate.
+        # This runs AFTER $addFields/$sort/$limit, so it can't hide anything
+        # the counting needs - it only trims what is sent back
+        {
+            '$project': project_fields
+        }
     ]
     
-    logger.debug(f"Pipeline has {len(pipeline)} stages (no projection)")
+    logger.debug(f"Pipeline has {len(pipeline)} stages, projecting {list(project_fields)}")
     
     return pipeline
 ```
 
-**Key change:** Removed the entire $project stage. MongoDB will return full documents with all fields.
+**Key change:** The $project stage moved to the very end of the pipeline. Everything that reads the uncovered fields ($match, $addFields, $sort) runs on the complete original documents; only the up-to-`limit` candidates sent back are trimmed.
+
+### **Large numbers of uncovered fields**
+
+With 100+ uncovered fields, one `$or` with 100+ branches makes MongoDB evaluate every branch per document and gives it little chance of picking index scans. Add these two methods to split the fields into chunks of at most 32, run one pipeline per chunk, and merge the candidates:
+
+```python
+def build_pipelines(
+    self,
+    uncovered_mappings: List[Dict[str, str]],
+    limit: int = 100,
+    chunk_size: int = 32
+) -> List[List[Dict[str, Any]]]:
+    """
+    Build one aggregation pipeline per chunk of uncovered fields
+    
+    Args:
+        uncovered_mappings: List of mapping dicts for uncovered fields
+        limit: Maximum number of candidate records per pipeline
+        chunk_size: Maximum number of fields ($or branches) per pipeline
+    
+    Returns:
+        List of MongoDB aggregation pipelines
+    """
+    return [
+        self.build_pipeline(uncovered_mappings[start:start + chunk_size], limit)
+        for start in range(0, len(uncovered_mappings), chunk_size)
+    ]
+
+def merge_candidates(
+    self,
+    results_per_pipeline: List[List[Dict[str, Any]]],
+    limit: int = 100
+) -> List[Dict[str, Any]]:
+    """
+    Merge candidate records from chunked pipelines
+    
+    A record found by several chunks has the fields each chunk projected
+    merged and its uncoveredFieldCount summed, so it ranks by (approximately)
+    how many uncovered fields it has overall.
+    
+    Args:
+        results_per_pipeline: Aggregation results, one list per pipeline
+        limit: Maximum number of candidate records to return
+    
+    Returns:
+        Candidate records sorted by uncoveredFieldCount (descending)
+    """
+    merged: Dict[Any, Dict[str, Any]] = {}
+    
+    for results in results_per_pipeline:
+        for record in results:
+            payment_id = record.get(self.payment_id_field)
+            
+            if payment_id is None:
+                continue
+            
+            if payment_id in merged:
+                # Each chunk projects different top-level objects - keep them
+                # all, summing the count
+                candidate = merged[payment_id]
+                field_count = candidate.get('uncoveredFieldCount', 0) + record.get('uncoveredFieldCount', 0)
+                candidate.update(record)
+                candidate['uncoveredFieldCount'] = field_count
+            else:
+                merged[payment_id] = dict(record)
+    
+    candidates = sorted(merged.values(), key=lambda r: r.get('uncoveredFieldCount', 0), reverse=True)
+    
+    return candidates[:limit]
+```
+
+In Phase 2, run each pipeline from `build_pipelines` with `execute_aggregation` and pass the `data` lists to `merge_candidates` instead of running one `build_pipeline`. With 32 or fewer uncovered fields this is still a single pipeline.
 
 ---
 
 ## Why This Will Work
 
-**Without $project:**
-- MongoDB returns the **complete original document** from the collection
-- Plus the `uncoveredFieldCount` field we added
-- All your MIFMP, MsgFees, PkBtcSubset fields will be there!
+**With $project last:**
+- $addFields counts against the **complete original document** from the collection
+- The result keeps the payment ID, the `uncoveredFieldCount` field we added, and the whole top-level objects that hold the uncovered fields
+- All your MIFMP, MsgFees, PkBtcSubset fields will be there - without shipping every unrelated part of wide payment documents
 
 **The Compass query confirmed this works:**
 ```javascript
@@ -200,9 +344,11 @@ db.odsMPYPaymentDetail.aggregate([
 ])
 ```
 
-This returned the full objects because $project explicitly listed them. But when we try to build that dynamically, something goes wrong.
+This returned the full objects because $project explicitly listed whole top-level objects, after the documents were already selected - exactly the shape of the new Stage 6.
+
+**Solution:** Only project at the very end, and only whole top-level objects!
 
-**Solution:** Don't use $project at all - just return everything!
+When running the pipeline, read the results through `mongo_client.stream_aggregation` (which sets the cursor batch size) if you don't need them all in memory at once.
 
 ---
 
@@ -264,7 +410,7 @@ The problem was **MongoDB's behavior with $addFields + $project** on nested fiel
 
 MongoDB can sometimes "optimize away" the original fields or restructure the document in unexpected ways.
 
-**The simple solution:** Don't project at all - just return full documents. They're a bit bigger, but Python can handle it fine, and all the data is there.
+**The simple solution:** Don't project until the very end - the counting stages see full documents, and the candidates sent back still carry every top-level object we read, without the unrelated bulk.
 
 ---
 
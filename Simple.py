@@ -36,7 +36,7 @@ Yes! That's a much simpler and more reliable approach! We already know Phase 1 w
 **aggregation_builder.py:**
 - Keep the aggregation pipeline (it works!)
 - **Remove** `select_optimal_records` method (we don't need it!)
-- **Add** simple method: `extract_payment_ids(aggregation_results)` - just get the IDs
+- **Add** simple method: `extract_payment_ids(aggregation_results, exclude=tested_payment_ids)` - just get the IDs
 
 **main.py Phase 2:**
 - Run aggregation
@@ -50,13 +50,14 @@ Yes! That's a much simpler and more reliable approach! We already know Phase 1 w
 
 ### **1. Update src/aggregation_builder.py**
 
-Replace `select_optimal_records` with this simpler method:
+Replace `select_optimal_records` with this simpler method (and add `Optional` and `Set` to the `typing` import):
 
 ```python
 def extract_payment_ids(
     self,
     aggregation_results: List[Dict[str, Any]],
-    max_ids: int = 10
+    max_ids: int = 10,
+    exclude: Optional[Set[str]] = None
 ) -> List[str]:
     """
     Simply extract payment IDs from aggregation results
@@ -64,15 +65,23 @@ def extract_payment_ids(
     Args:
         aggregation_results: Results from aggregation pipeline
         max_ids: Maximum number of payment IDs to return
+        exclude: Payment IDs to skip (e.g. already tested in Phase 1)
     
     Returns:
         List of payment IDs
     """
     payment_ids = []
     
-    for record in aggregation_results[:max_ids]:
+    for record in aggregation_results:
+        if len(payment_ids) >= max_ids:
+            break
+        
         payment_id = record.get(self.payment_id_field)
         
+        if exclude and payment_id in exclude:
+            logger.debug(f"Skipping payment ID: {payment_id} (already tested)")
+            continue
+        
         if payment_id:
             payment_ids.append(payment_id)
             logger.debug(f"Extracted payment ID: {payment_id} (has {record.get('uncoveredFieldCount', 0)} fields)")
@@ -86,6 +95,20 @@ def extract_payment_ids(
 
 ### **2. Update src/main.py - Replace `_run_phase2` method**
 
+Phase 2 candidates often include payment IDs Phase 1 already tested (their fields are already counted in coverage), so remember every tested ID and don't test it again. Add `Set` to the `typing` import and this to `__init__`:
+
+```python
+self.tested_payment_ids: Set[str] = set()
+```
+
+and at the top of `_test_single_payment_id`:
+
+```python
+self.tested_payment_ids.add(payment_id)
+```
+
+Then replace `_run_phase2`:
+
 ```python
 def _run_phase2(self) -> List[Dict[str, Any]]:
     """
@@ -115,23 +138,29 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         logger.separator('-', 60)
         logger.info("\nBuilding MongoDB aggregation pipeline...")
         
-        pipeline = self.aggregation_builder.build_pipeline(
+        # One pipeline per chunk of up to 32 fields - a huge $or is slow to
+        # evaluate and keeps MongoDB from using indexes
+        pipelines = self.aggregation_builder.build_pipelines(
             uncovered_mappings=uncovered_mappings,
             limit=100  # Get top 100 candidates
         )
         
-        logger.debug(f"Pipeline has {len(pipeline)} stages")
+        logger.debug(f"Built {len(pipelines)} pipeline(s)")
         
         # Execute aggregation
         logger.info("Executing aggregation to find candidate records...")
         
-        agg_result = self.mongo_client.execute_aggregation(pipeline)
-        
-        if not agg_result['success']:
-            logger.error(f"Aggregation failed: {agg_result.get('error')}")
-            return phase2_results
+        results_per_pipeline = []
+        for pipeline in pipelines:
+            agg_result = self.mongo_client.execute_aggregation(pipeline)
+            
+            if not agg_result['success']:
+                logger.error(f"Aggregation failed: {agg_result.get('error')}")
+                return phase2_results
+            
+            results_per_pipeline.append(agg_result['data'])
         
-        candidates = agg_result['data']
+        candidates = self.aggregation_builder.merge_candidates(results_per_pipeline, limit=100)
         logger.success(f"✓ Found {len(candidates)} candidate records")
         
         if len(candidates) == 0:
@@ -144,11 +173,12 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         
         payment_ids = self.aggregation_builder.extract_payment_ids(
             aggregation_results=candidates,
-            max_ids=10  # Test up to 10 payment IDs in Phase 2
+            max_ids=10,  # Test up to 10 payment IDs in Phase 2
+            exclude=self.tested_payment_ids  # Don't re-test Phase 1 IDs
         )
         
         if not payment_ids:
-            logger.error("Could not extract any payment IDs from candidates")
+            logger.warn("No untested payment IDs among the candidates")
             return phase2_results
         
         logger.success(f"✓ Will test {len(payment_ids)} payment IDs")
@@ -158,20 +188,44 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         logger.info(f"\nTesting {len(payment_ids)} selected payment IDs...")
         logger.info("(Using same logic as Phase 1 - known to work!)")
         
-        for idx, payment_id in enumerate(payment_ids, 1):
-            logger.info(f"\n[{idx}/{len(payment_ids)}] Testing Payment ID: {payment_id}")
-            logger.separator('-', 40)
-            
-            # Use the SAME method as Phase 1!
-            result = self._test_single_payment_id(payment_id)
-            result['phase'] = 2  # Mark as Phase 2
-            phase2_results.append(result)
-            
-            # Show quick summary
-            if result['success']:
-                logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed, {result.get('notCovered', 0)} not covered")
-            else:
-                logger.error(f"✗ Testing failed: {result.get('error')}")
+        # Fetch all MongoDB records in one query, as in Phase 1
+        records_result = self.mongo_client.find_by_payment_ids(
+            payment_ids,
+            self.test_config['paymentIdMapping']['mongoField']
+        )
+        records_by_id = records_result['data'] if records_result['success'] else {}
+        mongo_records = [records_by_id.get(str(payment_id)) for payment_id in payment_ids]
+        
+        # Same --parallel handling as Phase 1: overlap the MongoDB/API waits,
+        # still reporting results in order. CoverageTracker and Comparator
+        # lock the state the worker threads share
+        executor = None
+        parallel_results = None
+        if self.parallel > 1:
+            executor = ThreadPoolExecutor(max_workers=min(self.parallel, len(payment_ids)))
+            parallel_results = executor.map(self._test_single_payment_id, payment_ids, mongo_records)
+        
+        try:
+            for idx, payment_id in enumerate(payment_ids, 1):
+                logger.info(f"\n[{idx}/{len(payment_ids)}] Testing Payment ID: {payment_id}")
+                logger.separator('-', 40)
+                
+                # Use the SAME method as Phase 1!
+                if parallel_results is not None:
+                    result = next(parallel_results)
+                else:
+                    result = self._test_single_payment_id(payment_id, mongo_records[idx - 1])
+                result['phase'] = 2  # Mark as Phase 2
+                phase2_results.append(result)
+                
+                # Show quick summary
+                if result['success']:
+                    logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed, {result.get('notCovered', 0)} not covered")
+                else:
+                    logger.error(f"✗ Testing failed: {result.get('error')}")
+        finally:
+            if executor:
+                executor.shutdown()
         
         # Show coverage improvement
         coverage_after = self.coverage_tracker.get_coverage_summary()
@@ -197,8 +251,8 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
 
 1. **Get uncovered fields** → e.g., 137 fields
 2. **Run aggregation** → Find 100 payment IDs that have ANY of these fields
-3. **Extract top 10 payment IDs** → Just grab the IDs, don't analyze fields
-4. **Test each with Phase 1 logic** → Call `_test_single_payment_id(payment_id)`
+3. **Extract top 10 payment IDs** → Just grab the IDs not already tested in Phase 1, don't analyze fields
+4. **Test each with Phase 1 logic** → Call `_test_single_payment_id(payment_id, mongo_record)`
 5. **Coverage tracker automatically updates** → It already tracks what gets covered!
 
 ---
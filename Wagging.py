@@ -7,7 +7,7 @@ Let's implement your **much simpler approach** - one attribute at a time, find O
 ## Super Simple Phase 2 Logic
 
 **For each uncovered attribute:**
-1. Query MongoDB: "Find ONE document where this field exists and has data"
+1. Query MongoDB: "Find ONE document where this field exists and has data" (all fields are asked in one aggregation, not one query each)
 2. Get that document's payment ID
 3. Test that payment ID using Phase 1 logic
 4. Move to next uncovered attribute
@@ -27,7 +27,9 @@ Aggregation Builder Module
 Simple approach: Find one record per uncovered field
 """
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
+from pymongo.errors import AutoReconnect
 from .logger import logger
 
 
@@ -42,6 +44,14 @@ class AggregationBuilder:
             payment_id_field: MongoDB field name for payment ID
         """
         self.payment_id_field = payment_id_field
+        
+        # (collection name, cleaned field) -> payment ID (None = no data), so
+        # repeated Phase 2 runs don't re-query fields already looked up
+        self._field_cache: Dict[Tuple[str, str], Optional[Any]] = {}
+    
+    def invalidate(self):
+        """Forget cached field lookups (call when the collection data changes)"""
+        self._field_cache.clear()
     
     def find_payment_id_for_field(
         self,
@@ -53,54 +63,308 @@ class AggregationBuilder:
         
         Args:
             mongo_client: MongoDB client instance
-            field_name: MongoDB field name (e.g., "MIFMP.DbAccNo" or "MsgFees[].FxRte")
+            field_name: MongoDB field name, already cleaned of [] notation
+                (e.g., "MIFMP.DbAccNo" or "MsgFees.FxRte" - the mapping's
+                '_cleanedField')
         
         Returns:
             Payment ID if found, None otherwise
         """
-        # Clean array notation
-        cleaned_field = field_name.replace('[]', '')
+        cleaned_field = field_name
         
-        logger.debug(f"  Searching for field: {field_name}")
-        if cleaned_field != field_name:
-            logger.debug(f"  Cleaned to: {cleaned_field}")
+        cache_key = (mongo_client.collection.name, cleaned_field)
+        if cache_key in self._field_cache:
+            return self._field_cache[cache_key]
+        
+        logger.debug("  Searching for field: %s", cleaned_field)
         
         try:
             # Simple query: find ONE document where this field exists and is not empty
             query = {
                 cleaned_field: {
                     '$exists': True,
-                    '$ne': None,
-                    '$ne': ""
+                    '$nin': [None, ""]
                 }
             }
             
             # Only get the payment ID field, nothing else
-            projection = {
-                self.payment_id_field: 1,
-                '_id': 0
-            }
+            projection = self._payment_id_projection()
             
             # Execute query
             result = mongo_client.collection.find_one(query, projection)
             
             if result and self.payment_id_field in result:
                 payment_id = result[self.payment_id_field]
-                logger.debug(f"  ✓ Found payment ID: {payment_id}")
-                return payment_id
+                logger.debug("  ✓ Found payment ID: %s", payment_id)
             else:
+                payment_id = None
                 logger.debug(f"  ✗ No record found with this field")
-                return None
+            
+            self._field_cache[cache_key] = payment_id
+            return payment_id
                 
         except Exception as e:
             logger.error(f"  Error searching for field: {str(e)}")
             return None
+    
+    def find_payment_ids_for_fields(
+        self,
+        mongo_client,
+        field_names: List[str],
+        batch_size: int = 50,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Find ONE payment ID with data for each of the given fields
+        
+        Instead of one query (and one network round-trip) per field, each
+        batch of fields is a single aggregation: every field gets its own
+        branch ($match + $limit 1) chained with $unionWith. Each branch still
+        runs as its own query - it can use an index on its field and stops at
+        the first match - but all results come back in one round-trip.
+        Batches run in parallel over PyMongo's connection pool.
+        
+        Args:
+            mongo_client: MongoDB client instance
+            field_names: MongoDB field names, already cleaned of [] notation
+            batch_size: Maximum number of fields per aggregation
+            max_workers: Maximum number of batches queried at once
+        
+        Returns:
+            Dict mapping each field name to a payment ID, or None if no
+            document has data for that field
+        """
+        payment_ids: Dict[str, Any] = {field: None for field in field_names}
+        collection = mongo_client.collection
+        
+        # Only query fields not already looked up in this collection
+        to_query = []
+        for field in field_names:
+            cache_key = (collection.name, field)
+            if cache_key in self._field_cache:
+                payment_ids[field] = self._field_cache[cache_key]
+            else:
+                to_query.append(field)
+        
+        batches = [to_query[start:start + batch_size] for start in range(0, len(to_query), batch_size)]
+        
+        if len(batches) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                batch_results = list(executor.map(lambda batch: self._query_batch(collection, batch), batches))
+        else:
+            batch_results = [self._query_batch(collection, batch) for batch in batches]
+        
+        for batch_payment_ids in batch_results:
+            # Cache only batches that completed, so a failed one is retried
+            if batch_payment_ids is None:
+                continue
+            
+            payment_ids.update(batch_payment_ids)
+            for field, payment_id in batch_payment_ids.items():
+                self._field_cache[(collection.name, field)] = payment_id
+        
+        found = sum(1 for payment_id in payment_ids.values() if payment_id is not None)
+        logger.debug(f"  Found payment IDs for {found}/{len(payment_ids)} fields")
+        
+        return payment_ids
+    
+    def _query_batch(self, collection, batch: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Run the $unionWith aggregation for one batch of fields
+        
+        Args:
+            collection: PyMongo collection
+            batch: MongoDB field names in this batch
+        
+        Returns:
+            Dict mapping each field to a payment ID (or None), or None if the
+            aggregation failed (retried once after a dropped connection)
+        """
+        branches = [self._field_branch(idx, field) for idx, field in enumerate(batch)]
+        
+        pipeline = branches[0] + [
+            {'$unionWith': {'coll': collection.name, 'pipeline': branch}}
+            for branch in branches[1:]
+        ]
+        
+        for attempt in range(2):
+            batch_payment_ids: Dict[str, Any] = {field: None for field in batch}
+            
+            try:
+                for record in collection.aggregate(pipeline):
+                    if self.payment_id_field in record:
+                        batch_payment_ids[batch[record['_fieldIndex']]] = record[self.payment_id_field]
+                return batch_payment_ids
+            except AutoReconnect as e:
+                # Connection dropped (e.g. primary stepdown) - the whole batch
+                # is one query, so one retry covers all of its fields
+                if attempt == 0:
+                    logger.warn(f"  Connection lost searching for {len(batch)} fields, retrying: {str(e)}")
+                    continue
+                logger.error(f"  Error searching for {len(batch)} fields: {str(e)}")
+            except Exception as e:
+                logger.error(f"  Error searching for {len(batch)} fields: {str(e)}")
+                break
+        
+        return None
+    
+    def find_candidates_covering(
+        self,
+        mongo_client,
+        field_names: List[str],
+        limit: int = 50
+    ) -> List[Tuple[Any, Set[str]]]:
+        """
+        Find documents with data for ANY of the given fields, and which of
+        the fields each one has
+        
+        One document often holds several uncovered fields, so testing it
+        covers them all with a single payment ID.
+        
+        Args:
+            mongo_client: MongoDB client instance
+            field_names: MongoDB field names, already cleaned of [] notation
+            limit: Maximum number of candidate documents
+        
+        Returns:
+            List of (payment ID, set of field names with data in that document)
+        """
+        cleaned_paths = sorted(set(field_names))
+        
+        query = {
+            '$or': [{path: {'$exists': True, '$nin': [None, ""]}} for path in cleaned_paths]
+        }
+        
+        try:
+            cursor = mongo_client.collection.find(query, self._fields_projection(cleaned_paths)).limit(limit)
+            candidates = self._collect_candidates(cursor, cleaned_paths)
+        except Exception as e:
+            logger.error(f"  Error searching for candidate records: {str(e)}")
+            candidates = []
+        
+        logger.debug(f"  Found {len(candidates)} candidate records")
+        
+        return candidates
+    
+    def sample_candidates(
+        self,
+        mongo_client,
+        field_names: List[str],
+        sample_size: int = 5000
+    ) -> List[Tuple[Any, Set[str]]]:
+        """
+        Find documents with data for any of the given fields in a random sample
+        
+        One $sample read, checked locally, instead of one lookup per field -
+        worth it when many fields are left, since a lookup for a field with
+        little data may have to scan much of the collection.
+        
+        Args:
+            mongo_client: MongoDB client instance
+            field_names: MongoDB field names, already cleaned of [] notation
+            sample_size: Number of documents to sample
+        
+        Returns:
+            List of (payment ID, set of field names with data in that document)
+        """
+        cleaned_paths = sorted(set(field_names))
+        
+        pipeline = [
+            {'$sample': {'size': sample_size}},
+            {'$project': self._fields_projection(cleaned_paths)}
+        ]
+        
+        try:
+            cursor = mongo_client.collection.aggregate(pipeline, allowDiskUse=True)
+            candidates = self._collect_candidates(cursor, cleaned_paths)
+        except Exception as e:
+            logger.error(f"  Error sampling candidate records: {str(e)}")
+            candidates = []
+        
+        logger.debug(f"  Found {len(candidates)} candidate records in a sample of {sample_size}")
+        
+        return candidates
+    
+    def _fields_projection(self, cleaned_paths: List[str]) -> Dict[str, int]:
+        """Projection returning the payment ID plus the given fields"""
+        # Skip a path when its parent is already projected (MongoDB rejects
+        # "A" and "A.B" in one projection)
+        projection = self._payment_id_projection()
+        for path in cleaned_paths:
+            if path in projection or any(path.startswith(parent + '.') for parent in projection):
+                continue
+            projection[path] = 1
+        
+        return projection
+    
+    def _collect_candidates(self, records, cleaned_paths: List[str]) -> List[Tuple[Any, Set[str]]]:
+        """Keep the records that have data for at least one of the fields"""
+        candidates = []
+        
+        for record in records:
+            if self.payment_id_field not in record:
+                continue
+            
+            covered = {path for path in cleaned_paths if self._has_data(record, path)}
+            if covered:
+                candidates.append((record[self.payment_id_field], covered))
+        
+        return candidates
+    
+    @staticmethod
+    def _has_data(record: Dict[str, Any], path: str) -> bool:
+        """
+        Check whether a record has a non-empty value at a dot-notation path
+        
+        Lists along the path are searched element by element, so
+        "MsgFees.FeeAmt" finds FeeAmt in any entry of the MsgFees array.
+        """
+        values = [record]
+        
+        for part in path.split('.'):
+            next_values = []
+            for value in values:
+                if isinstance(value, dict):
+                    if part in value:
+                        next_values.append(value[part])
+                elif isinstance(value, list):
+                    next_values.extend(item[part] for item in value if isinstance(item, dict) and part in item)
+            values = next_values
+        
+        return any(value is not None and value != "" and value != [] for value in values)
+    
+    def _field_branch(self, idx: int, field_name: str) -> List[Dict[str, Any]]:
+        """
+        Build the pipeline branch finding ONE document with data for a field
+        
+        Args:
+            idx: Position of the field in its batch (returned as '_fieldIndex')
+            field_name: MongoDB field name, already cleaned of [] notation
+        
+        Returns:
+            Aggregation stages for this field
+        """
+        return [
+            {'$match': {field_name: {'$exists': True, '$nin': [None, ""]}}},
+            {'$limit': 1},
+            {'$project': {**self._payment_id_projection(), '_fieldIndex': {'$literal': idx}}}
+        ]
+    
+    def _payment_id_projection(self) -> Dict[str, int]:
+        """Projection returning only the payment ID field"""
+        # {'_id': 1, '_id': 0} would collapse to {'_id': 0} and drop the
+        # payment ID, so only exclude _id when it isn't the payment ID field
+        if self.payment_id_field == '_id':
+            return {'_id': 1}
+        return {self.payment_id_field: 1, '_id': 0}
 ```
 
 ---
 
 ### **2. Update src/main.py - Replace `_run_phase2` method**
 
+It reads the uncovered fields with `CoverageTracker.get_uncovered_fields()`, which returns the MongoDB fields, their cleaned paths (`mapping['_cleanedField']` from config_loader) and the JSON attributes as parallel lists.
+
 ```python
 def _run_phase2(self) -> List[Dict[str, Any]]:
     """
@@ -111,78 +375,133 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         List of test results for Phase 2 payment IDs
     """
     phase2_results = []
-    tested_payment_ids = set()  # Track what we've already tested
+    # Track what we've already tested, with the uncovered attributes each
+    # payment ID was picked for - a dict rather than a set so payment IDs are
+    # tested in the order they were found, the same on every run
+    tested_payment_ids: Dict[Any, List[str]] = {}
     
     try:
-        # Get uncovered mappings
-        uncovered_mappings = self.coverage_tracker.get_uncovered_mappings()
+        # Get uncovered fields as parallel lists - the cleaned paths (no []
+        # array notation) were computed once when the mapping was loaded
+        mongo_fields, cleaned_fields, json_attrs = self.coverage_tracker.get_uncovered_fields()
         
-        if not uncovered_mappings:
+        if not mongo_fields:
             logger.info("No uncovered fields to search for")
             return phase2_results
         
-        logger.info(f"\n{len(uncovered_mappings)} attributes not yet covered")
+        logger.info(f"\n{len(mongo_fields)} attributes not yet covered")
         logger.info("Will search for ONE payment ID per uncovered field...")
         
         logger.separator('-', 60)
         logger.info(f"\nSearching MongoDB for payment IDs with uncovered fields...")
         
-        # For each uncovered field, find one payment ID
-        for idx, mapping in enumerate(uncovered_mappings, 1):
-            mongo_field = mapping['mongoField']
-            json_attr = mapping['jsonAttribute']
-            
-            logger.info(f"\n[{idx}/{len(uncovered_mappings)}] Field: {json_attr}")
-            logger.info(f"  MongoDB field: {mongo_field}")
-            
-            # Find payment ID for this field
-            payment_id = self.aggregation_builder.find_payment_id_for_field(
+        field_payment_ids: Dict[str, Any] = {}
+        remaining = set(cleaned_fields)
+        
+        # First use records that hold several uncovered fields at once -
+        # greedily take the one covering the most fields still open, so fewer
+        # payment IDs need a full test
+        candidates = self.aggregation_builder.find_candidates_covering(
+            mongo_client=self.mongo_client,
+            field_names=cleaned_fields
+        )
+        
+        # If more fields than one lookup batch are in none of them, also
+        # sample the collection - one read that may settle many sparse fields
+        found_fields = set().union(*(fields for _, fields in candidates))
+        unfound_fields = [field for field in cleaned_fields if field not in found_fields]
+        if len(unfound_fields) > 50:
+            candidates += self.aggregation_builder.sample_candidates(
                 mongo_client=self.mongo_client,
-                field_name=mongo_field
+                field_names=unfound_fields
             )
+        
+        while candidates and remaining:
+            payment_id, fields = max(candidates, key=lambda candidate: len(candidate[1] & remaining))
+            new_fields = fields & remaining
+            if not new_fields:
+                break
             
-            if not payment_id:
-                logger.warn(f"  ⚠ No payment ID found (field has no data in collection)")
-                continue
+            for field in new_fields:
+                field_payment_ids[field] = payment_id
+            remaining -= new_fields
+        
+        # Then find one payment ID for each field no candidate had - all of
+        # them in one aggregation (per batch of 50) instead of one query each
+        if remaining:
+            field_payment_ids.update(self.aggregation_builder.find_payment_ids_for_fields(
+                mongo_client=self.mongo_client,
+                field_names=[field for field in cleaned_fields if field in remaining]
+            ))
+        
+        # Per-field lines only in debug mode, otherwise a progress line every
+        # ~5% of the fields
+        total_fields = len(mongo_fields)
+        progress_every = max(1, total_fields // 20)
+        no_data_count = 0
+        
+        for idx, (mongo_field, cleaned_field, json_attr) in enumerate(zip(mongo_fields, cleaned_fields, json_attrs), 1):
+            logger.debug("[%d/%d] Field: %s (MongoDB field: %s)", idx, total_fields, json_attr, mongo_field)
             
-            # Check if we already tested this payment ID
-            if payment_id in tested_payment_ids:
-                logger.info(f"  ℹ Payment ID {payment_id} already tested, skipping")
-                continue
+            payment_id = field_payment_ids.get(cleaned_field)
+            
+            if not payment_id:
+                no_data_count += 1
+                logger.debug("  ⚠ No payment ID found (field has no data in collection)")
+            elif payment_id in tested_payment_ids:
+                # Already picked for another field - test it only once
+                tested_payment_ids[payment_id].append(json_attr)
+                logger.debug("  ℹ Payment ID %s already picked, skipping", payment_id)
+            else:
+                logger.debug("  → Will test payment ID: %s", payment_id)
+                tested_payment_ids[payment_id] = [json_attr]
             
-            # Test this payment ID
-            logger.info(f"  → Will test payment ID: {payment_id}")
-            tested_payment_ids.add(payment_id)
+            if idx % progress_every == 0 or idx == total_fields:
+                logger.info(f"  Checked {idx}/{total_fields} fields - {len(tested_payment_ids)} payment IDs to test")
+        
+        if no_data_count:
+            logger.warn(f"  ⚠ {no_data_count} fields have no data in collection")
         
         # Now test all unique payment IDs we found
         logger.separator('-', 60)
         logger.info(f"\nFound {len(tested_payment_ids)} unique payment IDs to test")
         logger.info("Testing using Phase 1 logic...\n")
         
-        for idx, payment_id in enumerate(tested_payment_ids, 1):
-            logger.info(f"[{idx}/{len(tested_payment_ids)}] Testing Payment ID: {payment_id}")
-            logger.separator('-', 40)
+        # Fetch all their MongoDB records in one $in query, as in Phase 1,
+        # instead of one query per payment ID
+        records_result = self.mongo_client.find_by_payment_ids(
+            list(tested_payment_ids),
+            self.test_config['paymentIdMapping']['mongoField']
+        )
+        records_by_id = records_result['data'] if records_result['success'] else {}
+        
+        for idx, (payment_id, json_attrs) in enumerate(tested_payment_ids.items(), 1):
+            # An earlier payment ID may already have covered every attribute
+            # this one was picked for - then testing it adds nothing
+            if all(self.coverage_tracker.is_covered(attr) for attr in json_attrs):
+                logger.info(f"[{idx}/{len(tested_payment_ids)}] ℹ Skipping {payment_id}, its {len(json_attrs)} attribute(s) are already covered")
+                continue
             
             # Use Phase 1 logic
-            result = self._test_single_payment_id(payment_id)
+            result = self._test_single_payment_id(payment_id, records_by_id.get(str(payment_id)))
             result['phase'] = 2
             phase2_results.append(result)
             
-            # Show summary
+            # One line per payment ID - result and coverage so far
+            coverage = self.coverage_tracker.get_coverage_counts()
+            progress = f"[{idx}/{len(tested_payment_ids)}] {payment_id}"
+            coverage_now = f"📊 {coverage['covered_count']}/{coverage['total_attributes']} ({coverage['coverage_percentage']:.1f}%)"
+            
             if result['success']:
-                logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed, {result.get('notCovered', 0)} not covered")
+                logger.success(f"{progress} ✓ {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed, {result.get('notCovered', 0)} not covered - {coverage_now}")
             else:
-                logger.error(f"✗ Testing failed: {result.get('error')}")
-            
-            # Show coverage update
-            coverage = self.coverage_tracker.get_coverage_summary()
-            logger.info(f"📊 Coverage now: {coverage['covered_count']}/{coverage['total_attributes']} ({coverage['coverage_percentage']:.1f}%)")
+                logger.error(f"{progress} ✗ Testing failed: {result.get('error')} - {coverage_now}")
         
         # Final summary
         logger.separator('-', 60)
-        final_coverage = self.coverage_tracker.get_coverage_summary()
+        final_coverage = self.coverage_tracker.get_coverage_counts()
         logger.info(f"\n✓ Phase 2 Complete!")
-        logger.info(f"  Tested {len(tested_payment_ids)} unique payment IDs")
+        logger.info(f"  Tested {len(phase2_results)} unique payment IDs ({len(tested_payment_ids) - len(phase2_results)} skipped)")
         logger.info(f"  Final coverage: {final_coverage['covered_count']}/{final_coverage['total_attributes']} ({final_coverage['coverage_percentage']:.1f}%)")
         
         if final_coverage['uncovered_count'] > 0:
@@ -239,64 +558,24 @@ Will search for ONE payment ID per uncovered field...
 
 ──────────────────────────────────────────────
 Searching MongoDB for payment IDs with uncovered fields...
-
-[1/137] Field: messageInformation.bbi
-  MongoDB field: MIFMP.Bbi
-  Searching for field: MIFMP.Bbi
-  ✓ Found payment ID: 23826054132004
-  → Will test payment ID: 23826054132004
-
-[2/137] Field: messageInformation.creditorAgent.name
-  MongoDB field: MIFMP.Bbk
-  Searching for field: MIFMP.Bbk
-  ✓ Found payment ID: BCTA0000H221
-  → Will test payment ID: BCTA0000H221
-
-[3/137] Field: messageInformation.outgoingCreditAmount
-  MongoDB field: MIFMP.OutGngCrAmt
-  Searching for field: MIFMP.OutGngCrAmt
-  ✓ Found payment ID: 23826054132004
-  ℹ Payment ID 23826054132004 already tested, skipping
-
-[4/137] Field: messageInformation.fees.amount
-  MongoDB field: MsgFees[].FeeAmt
-  Searching for field: MsgFees[].FeeAmt
-  Cleaned to: MsgFees.FeeAmt
-  ✓ Found payment ID: 2130913013200
-  → Will test payment ID: 2130913013200
-
+  Checked 6/137 fields - 3 payment IDs to test
+  Checked 12/137 fields - 5 payment IDs to test
 ...
-
-[137/137] Field: messageInformation.rareField
-  MongoDB field: MIFMP.RareField
-  Searching for field: MIFMP.RareField
-  ✗ No payment ID found (field has no data in collection)
-  ⚠ No payment ID found (field has no data in collection)
+  Checked 137/137 fields - 28 payment IDs to test
+  ⚠ 27 fields have no data in collection
 
 ──────────────────────────────────────────────
 Found 28 unique payment IDs to test
 Testing using Phase 1 logic...
 
-[1/28] Testing Payment ID: 23826054132004
-────────────────────────────────────────────
-✓ Completed: 245 passed, 12 warnings, 1 failed, 36 not covered
-📊 Coverage now: 170/294 (57.8%)
-
-[2/28] Testing Payment ID: BCTA0000H221
-────────────────────────────────────────────
-✓ Completed: 240 passed, 10 warnings, 0 failed, 44 not covered
-📊 Coverage now: 185/294 (62.9%)
-
+[1/28] 23826054132004 ✓ 245 passed, 12 warnings, 1 failed, 36 not covered - 📊 170/294 (57.8%)
+[2/28] BCTA0000H221 ✓ 240 passed, 10 warnings, 0 failed, 44 not covered - 📊 185/294 (62.9%)
 ...
-
-[28/28] Testing Payment ID: 23809062024004
-────────────────────────────────────────────
-✓ Completed: 250 passed, 15 warnings, 2 failed, 27 not covered
-📊 Coverage now: 267/294 (90.8%)
+[28/28] 23809062024004 ✓ 250 passed, 15 warnings, 2 failed, 27 not covered - 📊 267/294 (90.8%)
 
 ──────────────────────────────────────────────
 ✓ Phase 2 Complete!
-  Tested 28 unique payment IDs
+  Tested 28 unique payment IDs (0 skipped)
   Final coverage: 267/294 (90.8%)
   27 attributes still uncovered (no data in collection)
 ```
@@ -305,7 +584,7 @@ Testing using Phase 1 logic...
 
 ## Benefits of This Approach
 
-✅ **Simple** - One MongoDB query per field, easy to understand
+✅ **Simple** - One small "find ONE document" branch per field, sent to MongoDB together
 ✅ **Efficient** - Skips duplicate payment IDs automatically
 ✅ **Reliable** - Uses Phase 1 logic that we know works
 ✅ **Informative** - Shows progress for each attribute
@@ -313,13 +592,30 @@ Testing using Phase 1 logic...
 
 ---
 
+## Making the Lookups Fast
+
+Each field's branch is answered fastest by an index on **that field** - MongoDB then reads one index entry and stops. Without one it scans the collection until it finds a match, and for a field with no data anywhere that means the whole collection.
+
+For sparse fields that Phase 2 keeps looking for, a partial index stays small because it only holds documents that have the field:
+
+```javascript
+db.odsMPYPaymentDetail.createIndex(
+  { "MIFMP.Bbi": 1 },
+  { partialFilterExpression: { "MIFMP.Bbi": { $exists: true } } }
+)
+```
+
+Don't hint the payment ID index for these lookups: the `$match` is on a different field, so a hint would make MongoDB walk the entire payment ID index and fetch every document to check it - slower than the scan it was meant to avoid. The utility doesn't create indexes itself; add them with your DBA on the real collection.
+
+---
+
 ## Run It
 
 ```bash
 python run_test.py
 ```
 
-This will be slower than the aggregation approach (many individual queries instead of one aggregation), but it's **dead simple and will definitely work**.
+Each field is still looked up on its own (so no tricky counting logic), but all the lookups go to MongoDB in one aggregation per 50 fields instead of one round-trip each - it's **dead simple and will definitely work**.
 
 Later, once everything is working, we can optimize with smarter aggregation if needed!
 
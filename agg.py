@@ -27,7 +27,37 @@ This marks it as PASS, but it should be marked as NOT_COVERED (or NOT_TESTED).
 
 ### **Update src/comparator.py**
 
-Replace the `_compare_values` method with this improved version:
+Replace the `_compare_values` method with this improved version. It uses a few module-level constants - add them below the imports in `src/comparator.py`:
+
+```python
+# Types whose == matches deep_equal's JSON comparison exactly
+_EXACT_TYPES = frozenset({str, int, bool, type(None)})
+
+# MongoDB types compared numerically, with tolerance
+_NUMERIC_TYPES = frozenset({'Decimal128', 'Double', 'Float', 'BigDecimal'})
+
+# Comparison results with nothing value-specific in them, defined once;
+# _compare_values hands out a copy, since callers may modify a field's result
+_NOT_COVERED = {
+    'match': False,
+    'mismatchType': 'NOT_COVERED',
+    'severity': 'NOT_COVERED',
+    'note': 'Field has no data in either source (not covered)'
+}
+_EXACT_MATCH = {
+    'match': True,
+    'mismatchType': None,
+    'severity': 'PASS',
+    'note': None
+}
+_NUMERIC_MATCH = {
+    'match': True,
+    'mismatchType': None,
+    'severity': 'PASS',
+    'note': 'Values are numerically equal'
+}
+```
+
 
 ```python
 def _compare_values(
@@ -48,12 +78,7 @@ def _compare_values(
     
     # Both are None or null - NOT COVERED (no data to test)
     if value1 is None and value2 is None:
-        return {
-            'match': False,  # Changed from True
-            'mismatchType': 'NOT_COVERED',
-            'severity': 'NOT_COVERED',
-            'note': 'Field has no data in either source (not covered)'
-        }
+        return dict(_NOT_COVERED)  # 'match' is False - changed from True
     
     # One is None, other is not
     if value1 is None and value2 is not None:
@@ -72,14 +97,16 @@ def _compare_values(
             'note': f'{label1} has value, but {label2} is None'
         }
     
-    # Exact match
-    if deep_equal(value1, value2):
-        return {
-            'match': True,
-            'mismatchType': None,
-            'severity': 'PASS',
-            'note': None
-        }
+    # Exact match - most values are plain strings/numbers of the same type,
+    # so compare those directly instead of JSON-serializing both
+    value_type = type(value1)
+    if value_type is type(value2) and value_type in _EXACT_TYPES:
+        equal = value1 == value2
+    else:
+        equal = deep_equal(value1, value2)
+    
+    if equal:
+        return dict(_EXACT_MATCH)
     
     # Empty array vs None (Issue #2)
     if isinstance(value1, list) and len(value1) == 0 and value2 is None:
@@ -99,14 +126,9 @@ def _compare_values(
         }
     
     # Numeric comparison with tolerance (for decimals)
-    if data_type in ['Decimal128', 'Double', 'Float', 'BigDecimal']:
+    if data_type in _NUMERIC_TYPES:
         if safe_float_compare(value1, value2):
-            return {
-                'match': True,
-                'mismatchType': None,
-                'severity': 'PASS',
-                'note': 'Values are numerically equal'
-            }
+            return dict(_NUMERIC_MATCH)
     
     # Number formatting difference (Issue #3)
     if is_numeric_string(str(value1)) and is_numeric_string(str(value2)):
@@ -154,35 +176,36 @@ def _compare_values(
 
 Update the status counting logic to handle NOT_COVERED:
 
-Find this section in `_test_single_payment_id`:
+Find this loop in `_test_single_payment_id`:
 
 ```python
-# Count statuses
-if field_result['status'] == 'PASS':
-    result['passed'] += 1
-elif field_result['status'] in ['WARNING']:
-    result['warnings'] += 1
-elif field_result['status'] in ['CRITICAL', 'CRITICAL_ERROR']:
-    result['failed'] += 1
-elif field_result['status'] in ['ERROR']:
-    result['errors'] += 1
+for field_result in field_results:
+    result['fieldResults'].append(field_result)
+    
+    # Count statuses
+    if field_result['status'] == 'PASS':
+        result['passed'] += 1
+    elif field_result['status'] in ['WARNING']:
+        result['warnings'] += 1
+    elif field_result['status'] in ['CRITICAL', 'CRITICAL_ERROR']:
+        result['failed'] += 1
+    elif field_result['status'] in ['ERROR']:
+        result['errors'] += 1
 ```
 
-**Replace with:**
+**Replace with** (and add `from collections import Counter` to the imports) - one counting pass over the statuses instead of a chain of string compares per field:
 
 ```python
+result['fieldResults'].extend(field_results)
+
 # Count statuses
-if field_result['status'] == 'PASS':
-    result['passed'] += 1
-elif field_result['status'] in ['WARNING']:
-    result['warnings'] += 1
-elif field_result['status'] in ['CRITICAL', 'CRITICAL_ERROR']:
-    result['failed'] += 1
-elif field_result['status'] in ['ERROR']:
-    result['errors'] += 1
-elif field_result['status'] in ['NOT_COVERED']:
-    # Don't count as passed or failed - it's uncovered
-    pass  # Will be tracked by coverage tracker separately
+status_counts = Counter(field_result['status'] for field_result in field_results)
+result['passed'] = status_counts['PASS']
+result['warnings'] = status_counts['WARNING']
+result['failed'] = status_counts['CRITICAL'] + status_counts['CRITICAL_ERROR']
+result['errors'] = status_counts['ERROR']
+# Neither passed nor failed - the field had no data to test
+result['notCovered'] = status_counts['NOT_COVERED']
 ```
 
 Also update the result dictionary initialization:
@@ -200,13 +223,6 @@ result = {
 }
 ```
 
-And update the counting:
-
-```python
-elif field_result['status'] in ['NOT_COVERED']:
-    result['notCovered'] += 1
-```
-
 And update the summary display:
 
 ```python
@@ -406,26 +422,27 @@ class AggregationBuilder:
             match_conditions.append({
                 field: {
                     '$exists': True,
-                    '$ne': None,
-                    '$ne': ""
+                    '$nin': [None, ""]
                 }
             })
         
-        # Build expressions to count how many uncovered fields each document has
-        count_expressions = []
-        for field in uncovered_fields:
-            count_expressions.append({
-                '$cond': [
-                    {
+        # Build expression to count how many uncovered fields each document has:
+        # a single $filter over the list of field references, instead of one
+        # $cond per field summed with $add
+        count_expression = {
+            '$size': {
+                '$filter': {
+                    'input': [f'${field}' for field in uncovered_fields],
+                    'as': 'v',
+                    'cond': {
                         '$and': [
-                            {'$ne': [f'${field}', None]},
-                            {'$ne': [f'${field}', ""]}
+                            {'$ne': ['$$v', None]},
+                            {'$ne': ['$$v', ""]}
                         ]
-                    },
-                    1,
-                    0
-                ]
-            })
+                    }
+                }
+            }
+        }
         
         # Build the pipeline
         pipeline = [
@@ -439,25 +456,32 @@ class AggregationBuilder:
             # Stage 2: Add field counting how many uncovered fields this record has
             {
                 '$addFields': {
-                    'uncoveredFieldCount': {
-                        '$add': count_expressions
-                    }
+                    'uncoveredFieldCount': count_expression
                 }
             },
             
-            # Stage 3: Sort by count (descending - records with most fields first)
+            # Stage 3: Filter out records with 0 count
+            {
+                '$match': {
+                    'uncoveredFieldCount': {'$gt': 0}
+                }
+            },
+            
+            # Stage 4: Sort by count (descending - records with most fields first)
+            # $sort must be immediately followed by $limit so MongoDB can
+            # coalesce them into a bounded top-K sort
             {
                 '$sort': {
                     'uncoveredFieldCount': -1
                 }
             },
             
-            # Stage 4: Limit to top candidates
+            # Stage 5: Limit to top candidates
             {
                 '$limit': limit
             },
             
-            # Stage 5: Project only what we need
+            # Stage 6: Project only what we need (must stay AFTER $limit)
             {
                 '$project': {
                     self.payment_id_field: 1,
@@ -563,9 +587,42 @@ def get_field_with_dot_notation(record: Dict[str, Any], field_path: str) -> Any:
 
 ### **Add to src/mongo_client.py**
 
-Add this method to the `MongoDBClient` class:
+Add `Iterator` to the `typing` import, then add these methods to the `MongoDBClient` class:
 
 ```python
+def stream_aggregation(
+    self,
+    pipeline: List[Dict[str, Any]],
+    batch_size: int = 500
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run an aggregation pipeline and yield records as the cursor fetches them
+    
+    Unlike execute_aggregation, results are never held in memory all at once.
+    Errors are raised to the caller (OperationFailure etc.).
+    
+    Args:
+        pipeline: MongoDB aggregation pipeline
+        batch_size: Number of documents fetched per round-trip
+    
+    Yields:
+        Records with '_id' converted to string
+    """
+    if self.collection is None:
+        raise ConnectionError('Not connected to MongoDB')
+    
+    logger.debug("Streaming aggregation pipeline...")
+    
+    cursor = self.collection.aggregate(pipeline, batchSize=batch_size, allowDiskUse=True)
+    
+    with cursor:
+        for record in cursor:
+            # Convert ObjectId to string
+            if '_id' in record:
+                record['_id'] = str(record['_id'])
+            yield record
+
+
 def execute_aggregation(self, pipeline: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Execute an aggregation pipeline
@@ -586,12 +643,7 @@ def execute_aggregation(self, pipeline: List[Dict[str, Any]]) -> Dict[str, Any]:
     try:
         logger.debug("Executing aggregation pipeline...")
         
-        results = list(self.collection.aggregate(pipeline))
-        
-        # Convert ObjectId to string in results
-        for record in results:
-            if '_id' in record:
-                record['_id'] = str(record['_id'])
+        results = list(self.stream_aggregation(pipeline))
         
         logger.debug(f"Aggregation returned {len(results)} records")
         
@@ -778,6 +830,9 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         logger.separator('-', 60)
         logger.info(f"\nTesting {len(selected_records)} selected payment IDs...")
         
+        # Fetch all selected records up front instead of one query per payment ID
+        records_by_id = self._fetch_records([r['paymentId'] for r in selected_records])
+        
         for idx, record_info in enumerate(selected_records, 1):
             payment_id = record_info['paymentId']
             covers_fields = record_info['coversFields']
@@ -786,7 +841,7 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
             logger.info(f"  Expected to cover {len(covers_fields)} new fields")
             logger.separator('-', 40)
             
-            result = self._test_single_payment_id(payment_id)
+            result = self._test_single_payment_id(payment_id, records_by_id.get(str(payment_id)))
             result['phase'] = 2  # Mark as Phase 2
             result['expectedCoverage'] = covers_fields
             phase2_results.append(result)
@@ -806,6 +861,113 @@ def _run_phase2(self) -> List[Dict[str, Any]]:
         return phase2_results
 ```
 
+Fetch the records in one batch instead of one `find_one` round-trip per payment ID, using `MongoDBClient.find_by_payment_ids` (one `$in` query). Add this method:
+
+```python
+def _fetch_records(self, payment_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch MongoDB records for many payment IDs with one query
+    
+    Args:
+        payment_ids: Payment IDs to fetch
+    
+    Returns:
+        Dict mapping payment ID (as a string) to its record - IDs not found,
+        or a failed lookup, are left out, so _test_single_payment_id falls
+        back to querying them itself
+    """
+    payment_id_mongo_field = self.test_config['paymentIdMapping']['mongoField']
+    
+    records_result = self.mongo_client.find_by_payment_ids(payment_ids, payment_id_mongo_field)
+    if not records_result['success']:
+        logger.warn(f"Batch lookup failed, querying payment IDs one by one: {records_result['error']}")
+        return {}
+    
+    logger.debug(f"Fetched {len(records_result['data'])} of {len(payment_ids)} records in one query")
+    
+    return records_result['data']
+```
+
+`_run_phase1` below runs payment IDs on threads with `--parallel`, and both phases pass each prefetched record to `_test_single_payment_id`. Add the import:
+
+```python
+from concurrent.futures import ThreadPoolExecutor
+```
+
+Add a `parallel: int = 1` argument to `__init__` (passed from the `--parallel` command-line option) and store it:
+
+```python
+self.parallel = max(1, parallel)  # Payment IDs tested at the same time
+```
+
+And let `_test_single_payment_id` take an already fetched record - it only queries MongoDB itself when none is passed:
+
+```python
+def _test_single_payment_id(
+    self,
+    payment_id: str,
+    mongo_record: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    ...
+    # Step 1: Query MongoDB (unless the record was fetched in a batch)
+    if mongo_record is None:
+        mongo_result = self.mongo_client.find_by_payment_id(payment_id, payment_id_mongo_field)
+        
+        if not mongo_result['success'] or not mongo_result['data']:
+            result['error'] = f"MongoDB query failed or no data found"
+            logger.error(f"  ✗ {result['error']}")
+            return result
+        
+        mongo_record = mongo_result['data']
+```
+
+Use it in `_run_phase1` too:
+
+```python
+def _run_phase1(self) -> List[Dict[str, Any]]:
+    """Run Phase 1: Test configured payment IDs"""
+    
+    phase1_results = []
+    payment_ids = self.test_config['testPaymentIds']
+    
+    logger.info(f"\nTesting {len(payment_ids)} configured payment IDs...")
+    logger.separator('-', 60)
+    
+    records_by_id = self._fetch_records(payment_ids)
+    records = [records_by_id.get(str(payment_id)) for payment_id in payment_ids]
+    
+    # Each test mostly waits on MongoDB and the APIs, so with --parallel
+    # threads overlap that waiting; results are still reported in order
+    executor = None
+    parallel_results = None
+    if self.parallel > 1:
+        logger.info(f"Running up to {self.parallel} payment IDs at a time")
+        executor = ThreadPoolExecutor(max_workers=self.parallel)
+        parallel_results = executor.map(self._test_single_payment_id, payment_ids, records)
+    
+    try:
+        for idx, payment_id in enumerate(payment_ids, 1):
+            logger.info(f"\n[{idx}/{len(payment_ids)}] Testing Payment ID: {payment_id}")
+            logger.separator('-', 40)
+            
+            if parallel_results is not None:
+                result = next(parallel_results)
+            else:
+                result = self._test_single_payment_id(payment_id, records[idx - 1])
+            phase1_results.append(result)
+            
+            # Show quick summary
+            if result['success']:
+                logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed")
+            else:
+                logger.error(f"✗ Testing failed: {result.get('error')}")
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    return phase1_results
+```
+
 Update `_generate_summary` to handle both phases:
 
 ```python
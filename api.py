@@ -4,23 +4,54 @@ API Client Module
 Handles API calls with retry logic and error handling
 """
 
+import json
 import requests
+import threading
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
 from .logger import logger
 
+try:
+    import orjson  # Faster parsing of large API responses
+except ImportError:
+    orjson = None
+
 
 class APIClient:
     """Handles API calls with authentication and retry logic"""
     
-    def __init__(self, token_manager):
+    def __init__(self, token_manager, parallel: int = 1):
         """
         Initialize API client
         
         Args:
             token_manager: TokenManager instance for authentication
+            parallel: Number of threads calling call_both_apis at the same time
         """
         self.token_manager = token_manager
+        
+        # One pooled session for every call - keeps the TCP/TLS connections
+        # to the Java 8 and Java 21 hosts open between payment IDs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Runs the Java 8 call while the Java 21 call runs on the caller's
+        # thread - one worker per calling thread, so --parallel tests don't
+        # queue behind each other's Java 8 calls
+        self._executor = ThreadPoolExecutor(max_workers=max(1, parallel))
+        
+        # Identical requests already on the wire: (url, body) -> Future
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def close(self):
+        """Stop the Java 8 worker threads and close pooled connections"""
+        self._executor.shutdown()
+        self.session.close()
     
     def call_api(
         self, 
@@ -28,6 +59,56 @@ class APIClient:
         request_body: Dict[str, Any], 
         max_retries: int = 3,
         timeout: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Call API, sharing the result of an identical request already in flight
+        
+        When the same payment ID is requested concurrently (parallel runs,
+        retries), only the first caller hits the API; the others wait for
+        its result instead of sending a duplicate request.
+        
+        Args:
+            url: API endpoint URL
+            request_body: Request body (will be sent as JSON)
+            max_retries: Maximum number of retry attempts
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Dict with 'success' (bool), 'data' (dict or None), 'error' (str or None),
+            'statusCode' (int or None)
+        """
+        key = (url, json.dumps(request_body, sort_keys=True, default=str))
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            logger.debug(f"Waiting for identical in-flight request: {url}")
+            return future.result()
+        
+        try:
+            result = self._call_api_with_retry(url, request_body, max_retries, timeout)
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._inflight_lock:
+            del self._inflight[key]
+        
+        future.set_result(result)
+        return result
+    
+    def _call_api_with_retry(
+        self, 
+        url: str, 
+        request_body: Dict[str, Any], 
+        max_retries: int,
+        timeout: int
     ) -> Dict[str, Any]:
         """
         Call API with retry logic
@@ -67,7 +148,7 @@ class APIClient:
                 # Make request
                 logger.debug(f"Calling API: {url} (attempt {attempt}/{max_retries})")
                 
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json=request_body,
                     headers=headers,
@@ -77,7 +158,7 @@ class APIClient:
                 # Success
                 if response.status_code == 200:
                     try:
-                        data = response.json()
+                        data = orjson.loads(response.content) if orjson else response.json()
                         logger.debug(f"API call successful: {url}")
                         return {
                             'success': True,
@@ -186,6 +267,9 @@ class APIClient:
         """
         Call both Java 8 and Java 21 APIs
         
+        The two calls are independent, so when both URLs are given they run
+        concurrently and the total wait is the slower call, not the sum.
+        
         Args:
             java21_url: Java 21 API URL
             java8_url: Java 8 API URL (optional)
@@ -195,15 +279,17 @@ class APIClient:
             Dict with 'java21Result' and 'java8Result'
         """
         
+        # Start Java 8 API call in the background if URL provided
+        java8_future = None
+        if java8_url:
+            logger.debug("Calling Java 8 API...")
+            java8_future = self._executor.submit(self.call_api, java8_url, request_body)
+        
         # Call Java 21 API
         logger.debug("Calling Java 21 API...")
         java21_result = self.call_api(java21_url, request_body)
         
-        # Call Java 8 API if URL provided
-        java8_result = None
-        if java8_url:
-            logger.debug("Calling Java 8 API...")
-            java8_result = self.call_api(java8_url, request_body)
+        java8_result = java8_future.result() if java8_future else None
         
         return {
             'java21Result': java21_result,
@@ -217,14 +303,53 @@ Comparator Module
 Handles field-by-field comparison logic
 """
 
-from typing import Dict, Any, Optional
-from .utils import get_nested_value, deep_equal, safe_float_compare, is_numeric_string
+import threading
+from typing import Dict, Any, List, Optional
+from .utils import deep_equal, safe_float_compare, is_numeric_string
 from .logger import logger
 
 
+# MongoDB values that count as "no data" for a field
+_EMPTY_VALUES = (None, "", [], {})
+
+# Types whose == matches deep_equal's JSON comparison exactly
+_EXACT_TYPES = frozenset({str, int, bool, type(None)})
+
+# MongoDB types compared numerically, with tolerance
+_NUMERIC_TYPES = frozenset({'Decimal128', 'Double', 'Float', 'BigDecimal'})
+
+# Comparison results with nothing value-specific in them, defined once;
+# _compare_values hands out a copy, since callers may modify a field's result
+_EXACT_MATCH = {
+    'match': True,
+    'mismatchType': None,
+    'severity': 'PASS',
+    'note': None
+}
+_NUMERIC_MATCH = {
+    'match': True,
+    'mismatchType': None,
+    'severity': 'PASS',
+    'note': 'Values are numerically equal'
+}
+
+
 class Comparator:
     """Compares field values between MongoDB and API responses"""
     
+    def __init__(self):
+        """Initialize comparator"""
+        # Per-mapping lookups prepared for the mapping list last passed to
+        # compare_batch (see _prepare_mappings), swapped in as one tuple
+        self._prepared = (None, {}, [], {}, [], [])
+        
+        # Fields whose comparison was reused (empty MongoDB value, no API data)
+        self.skipped_comparisons = 0
+        
+        # compare_batch runs on worker threads with --parallel, so the shared
+        # counter is only updated under this lock
+        self._stats_lock = threading.Lock()
+    
     def compare_field(
         self,
         mongo_record: Dict[str, Any],
@@ -244,62 +369,150 @@ class Comparator:
         Returns:
             Dict with comparison results
         """
+        return self.compare_batch(mongo_record, java21_response, java8_response, [mapping])[0]
+    
+    def compare_batch(
+        self,
+        mongo_record: Dict[str, Any],
+        java21_response: Optional[Dict[str, Any]],
+        java8_response: Optional[Dict[str, Any]],
+        mappings: List[Dict[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare all mapped fields of one record across MongoDB and API responses
+        
+        The error state of each API response is the same for every field, so
+        it is worked out once here instead of once per field.
         
-        # Extract values
-        mongo_field = mapping['mongoField']
-        json_attribute = mapping['jsonAttribute']
-        mongo_type = mapping.get('mongoType', 'Unknown')
+        Args:
+            mongo_record: MongoDB record
+            java21_response: Java 21 API response
+            java8_response: Java 8 API response (optional)
+            mappings: List of field mapping dicts
         
-        mongo_value = get_nested_value(mongo_record, mongo_field)
+        Returns:
+            List of comparison result dicts, one per mapping (same order)
+        """
         
-        java21_value = None
         java21_error = None
-        if java21_response:
-            if 'success' in java21_response and not java21_response['success']:
-                java21_error = java21_response.get('error', 'Unknown error')
-            else:
-                java21_value = get_nested_value(java21_response, json_attribute)
+        if java21_response and 'success' in java21_response and not java21_response['success']:
+            java21_error = java21_response.get('error', 'Unknown error')
+        java21_data = java21_response if java21_response and not java21_error else None
         
-        java8_value = None
         java8_error = None
-        if java8_response:
-            if 'success' in java8_response and not java8_response['success']:
-                java8_error = java8_response.get('error', 'Unknown error')
-            else:
-                java8_value = get_nested_value(java8_response, json_attribute)
-        
-        # Compare MongoDB vs Java 21
-        mongo_vs_java21 = self._compare_values(
-            mongo_value, 
-            java21_value, 
-            mongo_type,
-            "MongoDB",
-            "Java 21"
-        )
-        
-        # Compare Java 8 vs Java 21 (if Java 8 available)
-        java8_vs_java21 = None
-        if java8_response and not java8_error:
-            java8_vs_java21 = self._compare_values(
-                java8_value,
-                java21_value,
+        if java8_response and 'success' in java8_response and not java8_response['success']:
+            java8_error = java8_response.get('error', 'Unknown error')
+        java8_data = java8_response if java8_response and not java8_error else None
+        
+        prepared = self._prepared
+        if prepared[0] is not mappings:
+            prepared = self._prepared = self._prepare_mappings(mappings)
+        _, mongo_index, mongo_paths, json_index, json_paths, mongo_types = prepared
+        
+        # Walk the record and each response once along the mapped paths; shared
+        # parents (MIFMP.BbkBic, MIFMP.OrgAdr1, ...) are only visited once
+        mongo_values = {}
+        self._collect_values(mongo_record, mongo_index, (), mongo_values)
+        
+        java21_values = {}
+        if java21_data:
+            self._collect_values(java21_data, json_index, (), java21_values)
+        
+        java8_values = {}
+        if java8_data:
+            self._collect_values(java8_data, json_index, (), java8_values)
+        
+        # With no API data every field compares against None, so for an empty
+        # MongoDB value the outcome only depends on which empty value it is -
+        # compare once per empty type and reuse it for the rest of the record
+        # (as copies, since callers may modify a field's comparison dicts)
+        no_api_data = java21_data is None and java8_data is None
+        empty_outcomes = {}
+        skipped = 0
+        
+        results = []
+        
+        for mapping, mongo_parts, json_parts, mongo_type in zip(
+            mappings, mongo_paths, json_paths, mongo_types
+        ):
+            # Extract values
+            mongo_value = mongo_values.get(mongo_parts)
+            java21_value = java21_values.get(json_parts)
+            java8_value = java8_values.get(json_parts)
+            
+            if no_api_data and mongo_value in _EMPTY_VALUES:
+                outcome = empty_outcomes.get(type(mongo_value))
+                if outcome is not None:
+                    mongo_vs_java21, java8_vs_java21, status = outcome
+                    mongo_vs_java21 = dict(mongo_vs_java21)
+                    if java8_vs_java21 is not None:
+                        java8_vs_java21 = dict(java8_vs_java21)
+                    skipped += 1
+                    results.append(self._field_result(
+                        mapping, mongo_value, java21_value, java8_value, java21_error, java8_error,
+                        mongo_vs_java21, java8_vs_java21, status
+                    ))
+                    continue
+            
+            # Compare MongoDB vs Java 21
+            mongo_vs_java21 = self._compare_values(
+                mongo_value, 
+                java21_value, 
                 mongo_type,
-                "Java 8",
+                "MongoDB",
                 "Java 21"
             )
+            
+            # Compare Java 8 vs Java 21 (if Java 8 available)
+            java8_vs_java21 = None
+            if java8_data:
+                java8_vs_java21 = self._compare_values(
+                    java8_value,
+                    java21_value,
+                    mongo_type,
+                    "Java 8",
+                    "Java 21"
+                )
+            
+            # Determine overall status
+            status = self._determine_status(
+                mongo_vs_java21,
+                java8_vs_java21,
+                java21_error,
+                java8_error
+            )
+            
+            if no_api_data and mongo_value in _EMPTY_VALUES:
+                empty_outcomes[type(mongo_value)] = (mongo_vs_java21, java8_vs_java21, status)
+            
+            results.append(self._field_result(
+                mapping, mongo_value, java21_value, java8_value, java21_error, java8_error,
+                mongo_vs_java21, java8_vs_java21, status
+            ))
         
-        # Determine overall status
-        status = self._determine_status(
-            mongo_vs_java21,
-            java8_vs_java21,
-            java21_error,
-            java8_error
-        )
+        if skipped:
+            with self._stats_lock:
+                self.skipped_comparisons += skipped
         
+        return results
+    
+    def _field_result(
+        self,
+        mapping: Dict[str, str],
+        mongo_value: Any,
+        java21_value: Any,
+        java8_value: Any,
+        java21_error: Optional[str],
+        java8_error: Optional[str],
+        mongo_vs_java21: Dict[str, Any],
+        java8_vs_java21: Optional[Dict[str, Any]],
+        status: str
+    ) -> Dict[str, Any]:
+        """Build the comparison result dict for one field"""
         return {
-            'mongoField': mongo_field,
-            'jsonAttribute': json_attribute,
-            'mongoType': mongo_type,
+            'mongoField': mapping['mongoField'],
+            'jsonAttribute': mapping['jsonAttribute'],
+            'mongoType': mapping.get('mongoType', 'Unknown'),
             'mongoValue': mongo_value,
             'java21Value': java21_value if not java21_error else f"ERROR: {java21_error}",
             'java8Value': java8_value if not java8_error else f"ERROR: {java8_error}" if java8_error else None,
@@ -309,6 +522,89 @@ class Comparator:
             'severity': mongo_vs_java21.get('severity', 'INFO')
         }
     
+    def _prepare_mappings(self, mappings: List[Dict[str, str]]) -> tuple:
+        """
+        Pull what the compare loop needs out of the mapping dicts, once per mapping list
+        
+        Args:
+            mappings: List of field mapping dicts
+        
+        Returns:
+            Tuple of (mappings, MongoDB path index, MongoDB path parts, JSON path
+            index, JSON path parts, MongoDB types), the path parts and types as
+            lists parallel to mappings
+        """
+        mongo_paths = []
+        json_paths = []
+        mongo_types = []
+        
+        for mapping in mappings:
+            # Paths are pre-split by config_loader; split here only for ad-hoc mappings
+            mongo_paths.append(
+                mapping.get('_mongoParts') or tuple(mapping['mongoField'].replace('[]', '').split('.'))
+            )
+            json_paths.append(
+                mapping.get('_jsonParts') or tuple(mapping['jsonAttribute'].split('.'))
+            )
+            mongo_types.append(mapping.get('mongoType', 'Unknown'))
+        
+        return (
+            mappings,
+            self._build_path_index(mongo_paths),
+            mongo_paths,
+            self._build_path_index(json_paths),
+            json_paths,
+            mongo_types
+        )
+    
+    def _build_path_index(self, paths: List[tuple]) -> Dict[str, Any]:
+        """
+        Build a tree of field path parts
+        
+        Args:
+            paths: Path parts tuple for each mapping
+        
+        Returns:
+            Nested dict, e.g. {"MIFMP": {"BbkBic": {}, "OrgAdr1": {}}, "amount": {}}
+        """
+        index = {}
+        
+        for parts in paths:
+            node = index
+            for part in parts:
+                node = node.setdefault(part, {})
+        
+        return index
+    
+    def _collect_values(
+        self,
+        obj: Any,
+        index: Dict[str, Any],
+        prefix: tuple,
+        values: Dict[tuple, Any]
+    ):
+        """
+        Collect values for every path in the index, walking obj only once
+        
+        Args:
+            obj: Record (or sub-document) to read from
+            index: Path tree from _build_path_index
+            prefix: Path parts leading to obj
+            values: Output dict of path parts tuple -> value (missing paths are left out)
+        """
+        if not isinstance(obj, dict):
+            return
+        
+        for part, children in index.items():
+            value = obj.get(part)
+            if value is None:
+                continue
+            
+            path = prefix + (part,)
+            values[path] = value
+            if children:
+                self._collect_values(value, children, path, values)
+    
     def _compare_values(
         self,
         value1: Any,
@@ -325,14 +621,16 @@ class Comparator:
             'severity' (str), 'note' (str or None)
         """
         
-        # Exact match
-        if deep_equal(value1, value2):
-            return {
-                'match': True,
-                'mismatchType': None,
-                'severity': 'PASS',
-                'note': None
-            }
+        # Exact match - most values are plain strings/numbers of the same
+        # type, so compare those directly instead of JSON-serializing both
+        value_type = type(value1)
+        if value_type is type(value2) and value_type in _EXACT_TYPES:
+            equal = value1 == value2
+        else:
+            equal = deep_equal(value1, value2)
+        
+        if equal:
+            return dict(_EXACT_MATCH)
         
         # Both are None or null
         if value1 is None and value2 is None:
@@ -378,14 +676,9 @@ class Comparator:
             }
         
         # Numeric comparison with tolerance (for decimals)
-        if data_type in ['Decimal128', 'Double', 'Float', 'BigDecimal']:
+        if data_type in _NUMERIC_TYPES:
             if safe_float_compare(value1, value2):
-                return {
-                    'match': True,
-                    'mismatchType': None,
-                    'severity': 'PASS',
-                    'note': 'Values are numerically equal'
-                }
+                return dict(_NUMERIC_MATCH)
         
         # Number formatting difference (Issue #3)
         if is_numeric_string(str(value1)) and is_numeric_string(str(value2)):
@@ -892,9 +1185,12 @@ Main Module
 Orchestrates the entire testing workflow
 """
 
+import argparse
 import sys
 import time
-from typing import Dict, Any, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from .logger import logger
 from .config_loader import config_loader
 from .mongo_client import MongoDBClient
@@ -906,16 +1202,26 @@ from .comparator import Comparator
 class TestOrchestrator:
     """Main orchestrator for the testing utility"""
     
-    def __init__(self, mapping_config_path: str, test_config_path: str):
+    def __init__(
+        self,
+        mapping_config_path: str,
+        test_config_path: str,
+        use_mongo_cache: bool = True,
+        parallel: int = 1
+    ):
         """
         Initialize orchestrator
         
         Args:
             mapping_config_path: Path to mapping config JSON
             test_config_path: Path to test config JSON
+            use_mongo_cache: Reuse MongoDB records already fetched for a payment ID
+            parallel: Number of payment IDs tested at the same time
         """
         self.mapping_config_path = mapping_config_path
         self.test_config_path = test_config_path
+        self.use_mongo_cache = use_mongo_cache
+        self.parallel = max(1, parallel)
         
         self.mapping_config = None
         self.test_config = None
@@ -960,6 +1266,8 @@ class TestOrchestrator:
         # Cleanup
         if self.mongo_client:
             self.mongo_client.close()
+        if self.api_client:
+            self.api_client.close()
         
         return True
     
@@ -1012,7 +1320,11 @@ class TestOrchestrator:
             self.mongo_client = MongoDBClient(
                 connection_string=self.test_config['mongoConnectionString'],
                 database=self.test_config['mongoDatabase'],
-                collection=self.test_config['mongoCollection']
+                collection=self.test_config['mongoCollection'],
+                cache_ttl=300 if self.use_mongo_cache else 0,
+                fields=[m['mongoField'] for m in self.mapping_config] + [
+                    self.test_config['paymentIdMapping']['mongoField']
+                ]
             )
             
             if not self.mongo_client.connect():
@@ -1040,7 +1352,7 @@ class TestOrchestrator:
             
             # Initialize API client
             logger.info("\nInitializing API client...")
-            self.api_client = APIClient(self.token_manager)
+            self.api_client = APIClient(self.token_manager, parallel=self.parallel)
             logger.success("✓ API client initialized")
             
             # Initialize comparator
@@ -1064,23 +1376,59 @@ class TestOrchestrator:
         logger.info(f"\nTesting {len(payment_ids)} configured payment IDs...")
         logger.separator('-', 60)
         
-        for idx, payment_id in enumerate(payment_ids, 1):
-            logger.info(f"\n[{idx}/{len(payment_ids)}] Testing Payment ID: {payment_id}")
-            logger.separator('-', 40)
-            
-            result = self._test_single_payment_id(payment_id)
-            phase1_results.append(result)
-            
-            # Show quick summary
-            if result['success']:
-                logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed")
-            else:
-                logger.error(f"✗ Testing failed: {result.get('error')}")
+        # Fetch all MongoDB records in one query instead of one per payment ID;
+        # any not returned here are still queried (and reported) individually
+        records_result = self.mongo_client.find_by_payment_ids(
+            payment_ids,
+            self.test_config['paymentIdMapping']['mongoField']
+        )
+        records_by_id = records_result['data'] if records_result['success'] else {}
+        mongo_records = [records_by_id.get(str(payment_id)) for payment_id in payment_ids]
+        
+        # Each test mostly waits on MongoDB and the APIs, so with --parallel
+        # threads overlap that waiting; results are still reported in order
+        executor = None
+        parallel_results = None
+        if self.parallel > 1:
+            logger.info(f"Running up to {self.parallel} payment IDs at a time")
+            executor = ThreadPoolExecutor(max_workers=self.parallel)
+            parallel_results = executor.map(self._test_single_payment_id, payment_ids, mongo_records)
+        
+        try:
+            for idx, payment_id in enumerate(payment_ids, 1):
+                logger.info(f"\n[{idx}/{len(payment_ids)}] Testing Payment ID: {payment_id}")
+                logger.separator('-', 40)
+                
+                if parallel_results is not None:
+                    result = next(parallel_results)
+                else:
+                    result = self._test_single_payment_id(payment_id, mongo_records[idx - 1])
+                phase1_results.append(result)
+                
+                # Show quick summary
+                if result['success']:
+                    logger.success(f"✓ Completed: {result['passed']} passed, {result['warnings']} warnings, {result['failed']} failed")
+                else:
+                    logger.error(f"✗ Testing failed: {result.get('error')}")
+        finally:
+            if executor:
+                executor.shutdown()
         
         return phase1_results
     
-    def _test_single_payment_id(self, payment_id: str) -> Dict[str, Any]:
-        """Test a single payment ID across all fields"""
+    def _test_single_payment_id(
+        self,
+        payment_id: str,
+        mongo_record: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Test a single payment ID across all fields
+        
+        Args:
+            payment_id: Payment ID to test
+            mongo_record: Record already fetched from MongoDB (e.g. by a batched
+                lookup); queried here if not given
+        """
         
         payment_id_mongo_field = self.test_config['paymentIdMapping']['mongoField']
         payment_id_json_attr = self.test_config['paymentIdMapping']['jsonAttribute']
@@ -1096,19 +1444,21 @@ class TestOrchestrator:
         }
         
         try:
-            # Step 1: Query MongoDB
-            logger.debug("Querying MongoDB...")
-            mongo_result = self.mongo_client.find_by_payment_id(
-                payment_id, 
-                payment_id_mongo_field
-            )
-            
-            if not mongo_result['success'] or not mongo_result['data']:
-                result['error'] = f"MongoDB query failed or no data found"
-                logger.error(f"  ✗ {result['error']}")
-                return result
+            # Step 1: Query MongoDB (unless the record was fetched in a batch)
+            if mongo_record is None:
+                logger.debug("Querying MongoDB...")
+                mongo_result = self.mongo_client.find_by_payment_id(
+                    payment_id, 
+                    payment_id_mongo_field
+                )
+                
+                if not mongo_result['success'] or not mongo_result['data']:
+                    result['error'] = f"MongoDB query failed or no data found"
+                    logger.error(f"  ✗ {result['error']}")
+                    return result
+                
+                mongo_record = mongo_result['data']
             
-            mongo_record = mongo_result['data']
             logger.debug(f"  ✓ MongoDB record found ({len(mongo_record)} fields)")
             
             # Step 2: Call APIs
@@ -1139,25 +1489,21 @@ class TestOrchestrator:
             # Step 3: Compare all fields
             logger.debug("Comparing fields...")
             
-            for mapping in self.mapping_config:
-                field_result = self.comparator.compare_field(
-                    mongo_record=mongo_record,
-                    java21_response=java21_result.get('data') if java21_result['success'] else java21_result,
-                    java8_response=java8_result.get('data') if java8_result and java8_result['success'] else java8_result,
-                    mapping=mapping
-                )
-                
-                result['fieldResults'].append(field_result)
-                
-                # Count statuses
-                if field_result['status'] == 'PASS':
-                    result['passed'] += 1
-                elif field_result['status'] in ['WARNING']:
-                    result['warnings'] += 1
-                elif field_result['status'] in ['CRITICAL', 'CRITICAL_ERROR']:
-                    result['failed'] += 1
-                elif field_result['status'] in ['ERROR']:
-                    result['errors'] += 1
+            field_results = self.comparator.compare_batch(
+                mongo_record=mongo_record,
+                java21_response=java21_result.get('data') if java21_result['success'] else java21_result,
+                java8_response=java8_result.get('data') if java8_result and java8_result['success'] else java8_result,
+                mappings=self.mapping_config
+            )
+            
+            result['fieldResults'].extend(field_results)
+            
+            # Count statuses - one pass, then read each bin
+            status_counts = Counter(field_result['status'] for field_result in field_results)
+            result['passed'] = status_counts['PASS']
+            result['warnings'] = status_counts['WARNING']
+            result['failed'] = status_counts['CRITICAL'] + status_counts['CRITICAL_ERROR']
+            result['errors'] = status_counts['ERROR']
             
             result['success'] = True
             
@@ -1252,19 +1598,26 @@ class TestOrchestrator:
 def main():
     """Main entry point"""
     
-    # Check command line arguments
-    if len(sys.argv) != 3:
-        print("\nUsage: python -m src.main <mapping_config_path> <test_config_path>")
-        print("\nExample:")
-        print("  python -m src.main configs/mapping-sample.json configs/test-sample.json")
-        print()
-        sys.exit(1)
-    
-    mapping_config_path = sys.argv[1]
-    test_config_path = sys.argv[2]
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        prog='python -m src.main',
+        epilog='Example: python -m src.main configs/mapping-sample.json configs/test-sample.json'
+    )
+    parser.add_argument('mapping_config_path', help='Path to mapping config JSON')
+    parser.add_argument('test_config_path', help='Path to test config JSON')
+    parser.add_argument('--no-mongo-cache', action='store_true',
+                        help='Always re-query MongoDB instead of reusing fetched records')
+    parser.add_argument('--parallel', type=int, default=1, metavar='N',
+                        help='Test up to N payment IDs at the same time (default: 1)')
+    args = parser.parse_args()
     
     # Create and run orchestrator
-    orchestrator = TestOrchestrator(mapping_config_path, test_config_path)
+    orchestrator = TestOrchestrator(
+        args.mapping_config_path,
+        args.test_config_path,
+        use_mongo_cache=not args.no_mongo_cache,
+        parallel=args.parallel
+    )
     success = orchestrator.run()
     
     # Exit with appropriate code
@@ -3,6 +3,7 @@ requirements.txt
 pymongo==4.6.0
 requests==2.31.0
 python-dotenv==1.0.0
+orjson==3.9.10
 
 
 logger.py
@@ -29,9 +30,18 @@ class Logger:
         'BOLD': '\033[1m'
     }
     
-    def __init__(self):
-        """Initialize logger with empty log storage"""
+    def __init__(self, debug_mode: bool = True):
+        """
+        Initialize logger with empty log storage
+        
+        Args:
+            debug_mode: If True, show DEBUG level logs (config_loader sets
+                this from DEBUG in .env)
+        """
         self.logs: List[str] = []
+        
+        # Callers check this flag before building expensive debug output
+        self.debug_mode = debug_mode
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in readable format"""
@@ -53,9 +63,15 @@ class Logger:
         """Log INFO level message"""
         self._log('INFO', message, self.COLORS['GREEN'])
     
-    def debug(self, message: str):
-        """Log DEBUG level message"""
-        self._log('DEBUG', message, self.COLORS['CYAN'])
+    def debug(self, message: str, *args):
+        """
+        Log DEBUG level message (only when debug_mode is on)
+        
+        Any extra args are %-formatted into message only when the line is
+        actually shown
+        """
+        if self.debug_mode:
+            self._log('DEBUG', message % args if args else message, self.COLORS['CYAN'])
     
     def warn(self, message: str):
         """Log WARN level message"""
@@ -102,7 +118,7 @@ Utils Module
 Helper functions used across the utility
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from urllib.parse import urlparse
 
 
@@ -125,18 +141,30 @@ def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
     if not obj or not path:
         return None
     
-    parts = path.split('.')
+    return get_nested_value_parts(obj, tuple(path.split('.')))
+
+
+def get_nested_value_parts(obj: Dict[str, Any], parts: Tuple[str, ...]) -> Any:
+    """
+    Get value from nested dictionary using a pre-split path
+    
+    Same as get_nested_value, but takes the path already split into its
+    parts (see ConfigLoader.load_mapping_config), so hot loops don't
+    re-parse the same dotted string for every record.
+    
+    Args:
+        obj: Dictionary to extract value from
+        parts: Path parts (e.g., ("user", "address", "city"))
+    
+    Returns:
+        Value at the path, or None if not found
+    """
     current = obj
     
     for part in parts:
+        current = current.get(part) if isinstance(current, dict) else None
         if current is None:
             return None
-        
-        # Regular nested access
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
-            return None
     
     return current
 
@@ -244,8 +272,10 @@ Loads configuration from JSON files and environment variables
 
 import json
 import os
+import sys
 from typing import Dict, List, Any
 from dotenv import load_dotenv
+from .logger import logger
 
 
 class ConfigLoader:
@@ -256,6 +286,9 @@ class ConfigLoader:
         # Load environment variables from .env file
         load_dotenv()
         self.env_loaded = True
+        
+        # DEBUG=false hides DEBUG level logs (shown by default)
+        logger.debug_mode = os.getenv('DEBUG', 'true').lower() != 'false'
     
     def load_mapping_config(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -298,6 +331,16 @@ class ConfigLoader:
                 if field not in mapping:
                     raise ValueError(f"Mapping entry {idx} missing required field: {field}")
         
+        # Pre-split field paths once, so comparisons don't re-parse them per record.
+        # Names and path parts repeat a lot across mappings (MIFMP, actualData, ...),
+        # so intern them to share one string object each
+        for mapping in mapping_config:
+            for field in required_fields:
+                mapping[field] = sys.intern(mapping[field])
+            mapping['_cleanedField'] = sys.intern(mapping['mongoField'].replace('[]', ''))
+            mapping['_mongoParts'] = tuple(sys.intern(part) for part in mapping['_cleanedField'].split('.'))
+            mapping['_jsonParts'] = tuple(sys.intern(part) for part in mapping['jsonAttribute'].split('.'))
+        
         return mapping_config
     
     def load_test_config(self, file_path: str) -> Dict[str, Any]:
@@ -836,6 +879,9 @@ TOKEN_API_URL=https://your-token-api.com/token
 # Token API Credentials (if needed)
 TOKEN_API_USERNAME=your_username
 TOKEN_API_PASSWORD=your_password
+
+# Logging (false hides DEBUG level logs)
+DEBUG=true
 .gitignore
 # Environment variables
 .env
@@ -903,16 +949,28 @@ MongoDB Client Module
 Handles all MongoDB operations
 """
 
+import threading
+import time
+from collections import OrderedDict
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 from typing import Dict, Any, Optional, List
 from .logger import logger
+from .utils import get_nested_value
 
 
 class MongoDBClient:
     """Handles MongoDB connections and queries"""
     
-    def __init__(self, connection_string: str, database: str, collection: str):
+    def __init__(
+        self,
+        connection_string: str,
+        database: str,
+        collection: str,
+        cache_ttl: float = 300,
+        cache_size: int = 10000,
+        fields: Optional[List[str]] = None
+    ):
         """
         Initialize MongoDB client
         
@@ -920,6 +978,11 @@ class MongoDBClient:
             connection_string: MongoDB connection string
             database: Database name
             collection: Collection name
+            cache_ttl: Seconds a record found by payment ID is reused before
+                querying again (0 disables the cache)
+            cache_size: Maximum number of cached records
+            fields: MongoDB fields to return from find_by_payment_id
+                (None returns whole documents)
         """
         self.connection_string = connection_string
         self.database_name = database
@@ -927,6 +990,13 @@ class MongoDBClient:
         self.client: Optional[MongoClient] = None
         self.db = None
         self.collection = None
+        self.projection = self._build_projection(fields) if fields else None
+        
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        # (payment_id_field, payment_id) -> (expiry time, record), least recently used first
+        self._record_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def connect(self) -> bool:
         """
@@ -966,24 +1036,48 @@ class MongoDBClient:
         Returns:
             Dict with 'success' (bool), 'data' (record or None), 'error' (str or None)
         """
-        if not self.collection:
+        if self.collection is None:
             return {
                 'success': False,
                 'data': None,
                 'error': 'Not connected to MongoDB'
             }
         
+        # Re-testing the same payment ID (retries, repeated runs) reuses the record
+        cache_key = (payment_id_field, payment_id)
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                cached = self._record_cache.get(cache_key)
+                if cached and cached[0] > time.monotonic():
+                    self._record_cache.move_to_end(cache_key)
+                else:
+                    cached = None
+            if cached:
+                logger.debug(f"Using cached record for payment ID: {payment_id}")
+                return {
+                    'success': True,
+                    'data': cached[1],
+                    'error': None
+                }
+        
         try:
             query = {payment_id_field: payment_id}
             logger.debug(f"Querying MongoDB: {query}")
             
-            record = self.collection.find_one(query)
+            record = self.collection.find_one(query, self.projection)
             
             if record:
                 # Convert ObjectId to string for JSON serialization
                 if '_id' in record:
                     record['_id'] = str(record['_id'])
                 
+                if self.cache_ttl > 0:
+                    with self._cache_lock:
+                        self._record_cache[cache_key] = (time.monotonic() + self.cache_ttl, record)
+                        self._record_cache.move_to_end(cache_key)
+                        if len(self._record_cache) > self.cache_size:
+                            self._record_cache.popitem(last=False)
+                
                 logger.debug(f"Found record for payment ID: {payment_id}")
                 return {
                     'success': True,
@@ -1013,6 +1107,96 @@ class MongoDBClient:
                 'error': f'Error querying MongoDB: {str(e)}'
             }
     
+    def find_by_payment_ids(self, payment_ids: List[str], payment_id_field: str) -> Dict[str, Any]:
+        """
+        Find the records for several payment IDs with one $in query
+        
+        One round trip instead of one find_one per payment ID. Found records
+        are also cached, so a later find_by_payment_id for them is free.
+        
+        Args:
+            payment_ids: Payment ID values to search for
+            payment_id_field: MongoDB field name for payment ID
+        
+        Returns:
+            Dict with 'success' (bool), 'data' (dict of payment ID -> record,
+            missing IDs left out), 'error' (str or None)
+        """
+        if self.collection is None:
+            return {
+                'success': False,
+                'data': None,
+                'error': 'Not connected to MongoDB'
+            }
+        
+        try:
+            logger.debug(f"Querying MongoDB for {len(payment_ids)} payment IDs")
+            
+            records = {}
+            for record in self.collection.find({payment_id_field: {'$in': list(payment_ids)}}, self.projection):
+                # Convert ObjectId to string for JSON serialization
+                if '_id' in record:
+                    record['_id'] = str(record['_id'])
+                records[str(get_nested_value(record, payment_id_field))] = record
+            
+            if self.cache_ttl > 0 and records:
+                expiry = time.monotonic() + self.cache_ttl
+                with self._cache_lock:
+                    for payment_id in payment_ids:
+                        record = records.get(str(payment_id))
+                        if record is not None:
+                            cache_key = (payment_id_field, payment_id)
+                            self._record_cache[cache_key] = (expiry, record)
+                            self._record_cache.move_to_end(cache_key)
+                    while len(self._record_cache) > self.cache_size:
+                        self._record_cache.popitem(last=False)
+            
+            logger.debug(f"Found {len(records)}/{len(payment_ids)} records")
+            return {
+                'success': True,
+                'data': records,
+                'error': None
+            }
+        
+        except OperationFailure as e:
+            logger.error(f"MongoDB operation failed: {str(e)}")
+            return {
+                'success': False,
+                'data': None,
+                'error': f'MongoDB operation failed: {str(e)}'
+            }
+        except Exception as e:
+            logger.error(f"Error querying MongoDB: {str(e)}")
+            return {
+                'success': False,
+                'data': None,
+                'error': f'Error: {str(e)}'
+            }
+    
+    def _build_projection(self, fields: List[str]) -> Dict[str, int]:
+        """
+        Build a find() projection returning only the given fields
+        
+        Wide payment documents are mostly fields that aren't mapped, so
+        projecting the leaf paths saves transferring and decoding them.
+        
+        Args:
+            fields: MongoDB field paths (array notation [] is stripped)
+        
+        Returns:
+            Projection dict, e.g. {"MIFMP.BbkBic": 1, "payment_id": 1}
+        """
+        projection = {}
+        
+        for path in sorted(set(field.replace('[]', '') for field in fields)):
+            # Skip paths already included through a projected parent
+            # (MongoDB rejects "A" and "A.B" in the same projection)
+            if any(path.startswith(parent + '.') for parent in projection):
+                continue
+            projection[path] = 1
+        
+        return projection
+    
     def test_collection_access(self) -> Dict[str, Any]:
         """
         Test if collection exists and has data
@@ -1020,7 +1204,7 @@ class MongoDBClient:
         Returns:
             Dict with collection stats
         """
-        if not self.collection:
+        if self.collection is None:
             return {
                 'success': False,
                 'error': 'Not connected to MongoDB'
@@ -23,7 +23,8 @@ Coverage Tracker Module
 Tracks which attributes have been tested and with which payment IDs
 """
 
-from typing import Dict, List, Set, Any
+import threading
+from typing import Dict, List, Set, Any, Tuple
 from .logger import logger
 
 
@@ -45,6 +46,14 @@ class CoverageTracker:
         # Track which fields had what values: {jsonAttribute: {paymentId: value}}
         self.field_values: Dict[str, Dict[str, Any]] = {}
         
+        # Number of covered attributes, kept up to date as fields are marked
+        # so progress reporting doesn't rescan every attribute
+        self.covered_count = 0
+        
+        # Payment IDs are tested on worker threads with --parallel, so the
+        # check-then-count below has to happen under a lock
+        self._lock = threading.Lock()
+        
         # Initialize all attributes as uncovered
         for mapping in mapping_config:
             json_attr = mapping['jsonAttribute']
@@ -73,11 +82,14 @@ class CoverageTracker:
         
         # Only mark as covered if it had actual data
         if had_data and value is not None:
-            if payment_id not in self.coverage[json_attribute]:
-                self.coverage[json_attribute].append(payment_id)
-            
-            # Store the value
-            self.field_values[json_attribute][payment_id] = value
+            with self._lock:
+                if payment_id not in self.coverage[json_attribute]:
+                    if not self.coverage[json_attribute]:
+                        self.covered_count += 1
+                    self.coverage[json_attribute].append(payment_id)
+                
+                # Store the value
+                self.field_values[json_attribute][payment_id] = value
     
     def mark_result(self, field_result: Dict[str, Any], payment_id: str):
         """
@@ -95,6 +107,10 @@ class CoverageTracker:
         
         self.mark_field_tested(json_attr, payment_id, had_data, mongo_value)
     
+    def is_covered(self, json_attribute: str) -> bool:
+        """Check whether an attribute has been tested with data"""
+        return bool(self.coverage.get(json_attribute))
+    
     def get_covered_attributes(self) -> List[str]:
         """Get list of attributes that have been tested with data"""
         return [attr for attr, payment_ids in self.coverage.items() if len(payment_ids) > 0]
@@ -105,32 +121,51 @@ class CoverageTracker:
     
     def get_uncovered_mappings(self) -> List[Dict[str, str]]:
         """Get mapping config entries for uncovered attributes"""
-        uncovered = self.get_uncovered_attributes()
-        return [m for m in self.mapping_config if m['jsonAttribute'] in uncovered]
+        # Check each mapping's own coverage entry - a dict lookup, instead of
+        # scanning the uncovered list once per mapping
+        return [m for m in self.mapping_config if not self.coverage[m['jsonAttribute']]]
+    
+    def get_uncovered_fields(self) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Get (MongoDB fields, cleaned MongoDB fields, JSON attributes) of
+        uncovered mappings as parallel lists
+        
+        Cleaned fields are the '_cleanedField' paths config_loader stores
+        when the mapping is loaded ([] array notation removed), cleaned here
+        for mappings that didn't come through config_loader.
+        """
+        uncovered_mappings = self.get_uncovered_mappings()
+        return (
+            [m['mongoField'] for m in uncovered_mappings],
+            [m.get('_cleanedField') or m['mongoField'].replace('[]', '') for m in uncovered_mappings],
+            [m['jsonAttribute'] for m in uncovered_mappings]
+        )
     
     def get_coverage_percentage(self) -> float:
         """Calculate coverage percentage"""
         if len(self.coverage) == 0:
             return 0.0
         
-        covered = len(self.get_covered_attributes())
+        return (self.covered_count / len(self.coverage)) * 100
+    
+    def get_coverage_counts(self) -> Dict[str, Any]:
+        """Get coverage counts only - no attribute lists, cheap to call per test"""
         total = len(self.coverage)
         
-        return (covered / total) * 100
+        return {
+            'total_attributes': total,
+            'covered_count': self.covered_count,
+            'uncovered_count': total - self.covered_count,
+            'coverage_percentage': self.get_coverage_percentage()
+        }
     
     def get_coverage_summary(self) -> Dict[str, Any]:
         """Get comprehensive coverage summary"""
-        covered_attrs = self.get_covered_attributes()
-        uncovered_attrs = self.get_uncovered_attributes()
+        summary = self.get_coverage_counts()
+        summary['covered_attributes'] = self.get_covered_attributes()
+        summary['uncovered_attributes'] = self.get_uncovered_attributes()
         
-        return {
-            'total_attributes': len(self.coverage),
-            'covered_count': len(covered_attrs),
-            'uncovered_count': len(uncovered_attrs),
-            'coverage_percentage': self.get_coverage_percentage(),
-            'covered_attributes': covered_attrs,
-            'uncovered_attributes': uncovered_attrs
-        }
+        return summary
     
     def get_attribute_details(self, json_attribute: str) -> Dict[str, Any]:
         """Get details about a specific attribute's coverage"""
@@ -83,6 +83,7 @@ pymongo==4.6.0
 requests==2.31.0
 python-dotenv==1.0.0
 deepdiff==6.7.1
+orjson==3.9.10
 ```
 
 ---
@@ -131,10 +132,15 @@ class Logger:
         colored_level = f"{self.COLORS[color]}{level}{self.COLORS['RESET']}"
         print(f"[{timestamp}] {colored_level}: {message}")
     
-    def debug(self, message: str):
-        """Debug level - only shows if debug_mode is True"""
+    def debug(self, message: str, *args):
+        """
+        Debug level - only shows if debug_mode is True
+        
+        Any extra args are %-formatted into message only when the line is
+        actually shown, so hot loops don't pay for formatting in normal mode
+        """
         if self.debug_mode:
-            self._log('DEBUG', message, 'CYAN')
+            self._log('DEBUG', message % args if args else message, 'CYAN')
     
     def info(self, message: str):
         """Info level - always shows"""
@@ -213,43 +219,38 @@ def get_nested_value(data: Any, path: str) -> Any:
     # Clean array notation [] from path
     path = path.replace('[]', '')
     
-    parts = path.split('.')
     current = data
     
-    for part in parts:
-        if current is None:
-            return None
+    # type() checks instead of isinstance() and one dict.get() per step:
+    # this runs for every mapped field of every record (MongoDB and both APIs)
+    for part in path.split('.'):
+        current_type = type(current)
         
-        # Handle list access
-        if isinstance(current, list):
-            try:
-                # If part is numeric, use as index
-                if part.isdigit():
-                    index = int(part)
-                    if index < len(current):
-                        current = current[index]
-                    else:
-                        return None
-                else:
-                    # Access first element if not numeric
-                    if len(current) > 0:
-                        current = current[0]
-                        # Then access the key in that element
-                        if isinstance(current, dict) and part in current:
-                            current = current[part]
-                        else:
-                            return None
-                    else:
-                        return None
-            except (ValueError, IndexError):
+        # Handle dict access
+        if current_type is dict:
+            current = current.get(part)
+            if current is None:
                 return None
         
-        # Handle dict access
-        elif isinstance(current, dict):
-            if part in current:
-                current = current[part]
-            else:
+        # Handle list access
+        elif current_type is list:
+            if not current:
                 return None
+            
+            # If part is numeric, use as index
+            if part.isdigit():
+                index = int(part)
+                if index >= len(current):
+                    return None
+                current = current[index]
+            else:
+                # Access the key in the first element if not numeric
+                current = current[0]
+                if type(current) is not dict:
+                    return None
+                current = current.get(part)
+                if current is None:
+                    return None
         else:
             # Can't navigate further
             return None
@@ -486,7 +487,7 @@ MongoDB Client Module
 Handles MongoDB connection and queries
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 from .logger import logger
@@ -495,7 +496,13 @@ from .logger import logger
 class MongoDBClient:
     """MongoDB client for querying payment data"""
     
-    def __init__(self, connection_string: str, database: str, collection: str):
+    def __init__(
+        self,
+        connection_string: str,
+        database: str,
+        collection: str,
+        fields: Optional[List[str]] = None
+    ):
         """
         Initialize MongoDB client
         
@@ -503,6 +510,8 @@ class MongoDBClient:
             connection_string: MongoDB connection string (with credentials from .env)
             database: Database name
             collection: Collection name
+            fields: MongoDB fields the comparison reads; find_by_payment_id only
+                returns their top-level objects (None returns whole documents)
         """
         self.connection_string = connection_string
         self.database_name = database
@@ -511,6 +520,12 @@ class MongoDBClient:
         self.db = None
         self.collection = None
         
+        # Payment documents carry many sub-objects no mapping reads - leave
+        # them on the server instead of transferring and decoding them
+        self.projection = None
+        if fields:
+            self.projection = {field.replace('[]', '').split('.', 1)[0]: 1 for field in fields}
+        
         logger.debug(f"MongoDB client initialized")
         logger.debug(f"  Database: {database}")
         logger.debug(f"  Collection: {collection}")
@@ -569,7 +584,7 @@ class MongoDBClient:
             query = {payment_id_field: payment_id}
             
             # Execute query
-            document = self.collection.find_one(query)
+            document = self.collection.find_one(query, self.projection)
             
             if document:
                 # Convert ObjectId to string if present
@@ -632,8 +647,7 @@ class MongoDBClient:
             query = {
                 cleaned_field: {
                     '$exists': True,
-                    '$ne': None,
-                    '$ne': ""
+                    '$nin': [None, ""]
                 }
             }
             
@@ -747,10 +761,16 @@ Handles API calls to Java 8 and Java 21 endpoints
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from .utils import get_nested_value
 from .logger import logger
 
+try:
+    import orjson  # Faster parsing of large API responses
+except ImportError:
+    orjson = None
+
 
 class APIClient:
     """Client for calling payment APIs"""
@@ -773,6 +793,13 @@ class APIClient:
         self.root_path = json_response_root_path
         self.payment_id_attribute = payment_id_attribute
         
+        # One pooled session for every call - keeps the TCP/TLS connections
+        # to the Java 8 and Java 21 hosts open between payment IDs
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         logger.debug("API client initialized")
         logger.debug(f"  Root path: {json_response_root_path}")
         logger.debug(f"  Payment ID attribute: {payment_id_attribute}")
@@ -798,7 +825,7 @@ class APIClient:
             logger.debug(f"  Request body: {request_body}")
             
             # Make POST request
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=request_body,
                 headers={
@@ -812,7 +839,7 @@ class APIClient:
             response.raise_for_status()
             
             # Parse JSON response
-            full_response = response.json()
+            full_response = orjson.loads(response.content) if orjson else response.json()
             
             logger.debug(f"✓ API responded with status {response.status_code}")
             
@@ -929,7 +956,10 @@ class ResponseParser:
     
     def extract_attributes_with_values(self, response: Any, prefix: str = '') -> Dict[str, Any]:
         """
-        Extract all attributes with their values (for debugging)
+        Extract all attributes with their values
+        
+        Same paths as extract_all_attributes, so a single walk of a response
+        gives every attribute's value for direct lookup.
         
         Args:
             response: API response
@@ -954,6 +984,11 @@ class ResponseParser:
                 else:
                     result[current_path] = value
         
+        elif isinstance(response, list):
+            # Top-level list - extract from first element
+            if len(response) > 0:
+                result.update(self.extract_attributes_with_values(response[0], prefix))
+        
         return result
 ```
 
@@ -1157,7 +1192,8 @@ class CoverageTracker:
         Returns:
             List of mapping dictionaries for uncovered attributes
         """
-        uncovered_attrs = self.get_uncovered_attributes()
+        # Keep it a set - membership is checked once per mapping
+        uncovered_attrs = self.to_be_covered - self.covered_attributes
         
         uncovered_mappings = []
         for mapping in self.mapping_config:
@@ -1349,6 +1385,8 @@ Coordinates the entire test workflow
 """
 
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Set
 from .config_loader import config_loader
 from .mongo_client import MongoDBClient
@@ -1380,6 +1418,9 @@ class TestOrchestrator:
         self.coverage_tracker = None
         self.reporter = None
         
+        # Runs the Java 8 call while the Java 21 call runs on the main thread
+        self.api_executor = ThreadPoolExecutor(max_workers=1)
+        
         # Result collectors
         self.attribute_results = []
         self.json_diff_results = []
@@ -1434,7 +1475,14 @@ class TestOrchestrator:
             
             # Initialize MongoDB client
             logger.info("  Initializing MongoDB client...")
-            self.mongo_client = MongoDBClient(mongo_conn, mongo_db, mongo_coll)
+            self.mongo_client = MongoDBClient(
+                mongo_conn,
+                mongo_db,
+                mongo_coll,
+                fields=[m['mongoField'] for m in self.mapping_config] + [
+                    self.test_config['paymentIdMapping']['mongoField']
+                ]
+            )
             
             if not self.mongo_client.connect():
                 logger.error("MongoDB connection failed")
@@ -1501,6 +1549,16 @@ class TestOrchestrator:
             
             mongo_doc = mongo_result['data']
             
+            # The two API calls are independent - start Java 8 in the background
+            # so the wait is the slower call, not both calls added together
+            java8_response = None
+            has_java8 = java8_url is not None
+            java8_future = None
+            
+            if has_java8:
+                logger.debug(f"  Step 3: Calling Java 8 API...")
+                java8_future = self.api_executor.submit(self.api_client.call_api, payment_id, java8_url)
+            
             # Step 2: Call Java 21 API
             logger.debug(f"  Step 2: Calling Java 21 API...")
             java21_result = self.api_client.call_api(payment_id, java21_url)
@@ -1512,13 +1570,9 @@ class TestOrchestrator:
             
             java21_response = java21_result['data']
             
-            # Step 3: Call Java 8 API (if exists)
-            java8_response = None
-            has_java8 = java8_url is not None
-            
-            if has_java8:
-                logger.debug(f"  Step 3: Calling Java 8 API...")
-                java8_result = self.api_client.call_api(payment_id, java8_url)
+            # Step 3: Collect Java 8 API result (if exists)
+            if java8_future:
+                java8_result = java8_future.result()
                 
                 if java8_result['success']:
                     java8_response = java8_result['data']
@@ -1534,13 +1588,21 @@ class TestOrchestrator:
             
             # Step 5: Parse API response to get all attributes
             logger.debug(f"  Step 5: Parsing API response attributes...")
-            response_attributes = self.response_parser.extract_all_attributes(java21_response)
+            # Flatten each response once - values are then plain dict lookups
+            # instead of a walk from the root per attribute
+            java21_values = self.response_parser.extract_attributes_with_values(java21_response)
+            java8_values = self.response_parser.extract_attributes_with_values(java8_response) if java8_response else {}
+            response_attributes = list(java21_values)
             
             logger.debug(f"    Found {len(response_attributes)} attributes in response")
             
             # Step 6: Compare each attribute
             logger.debug(f"  Step 6: Comparing attributes...")
             
+            # Several attributes can map to the same MongoDB field (e.g. _id) -
+            # look each field up once for this record
+            mongo_values: Dict[str, Any] = {}
+            
             for attribute in response_attributes:
                 # Look up MongoDB field for this attribute
                 mongo_field = self.json_to_mongo_map.get(attribute)
@@ -1551,9 +1613,12 @@ class TestOrchestrator:
                     continue
                 
                 # Get values from all sources
-                mongo_value = get_nested_value(mongo_doc, mongo_field.replace('[]', ''))
-                java21_value = get_nested_value(java21_response, attribute)
-                java8_value = get_nested_value(java8_response, attribute) if java8_response else None
+                if mongo_field in mongo_values:
+                    mongo_value = mongo_values[mongo_field]
+                else:
+                    mongo_value = mongo_values[mongo_field] = get_nested_value(mongo_doc, mongo_field)
+                java21_value = java21_values[attribute]
+                java8_value = java8_values.get(attribute)
                 
                 # Compare values
                 status = self.comparator.compare_values(mongo_value, java21_value, java8_value)
@@ -1720,10 +1785,11 @@ class TestOrchestrator:
         """Print final test summary"""
         logger.header("TEST SUMMARY")
         
-        # Calculate stats
+        # Calculate stats (one counting pass over all attribute results)
+        status_counts = Counter(r['status'] for r in self.attribute_results)
         total_tested = len(self.attribute_results)
-        total_passed = sum(1 for r in self.attribute_results if r['status'] == 'PASS')
-        total_failed = sum(1 for r in self.attribute_results if r['status'] == 'FAIL')
+        total_passed = status_counts['PASS']
+        total_failed = status_counts['FAIL']
         
         coverage = self.coverage_tracker.get_coverage_summary()
         
@@ -1739,7 +1805,7 @@ class TestOrchestrator:
         logger.warn(f"  ⚠ Uncovered: {coverage['uncovered_count']} ({100-coverage['coverage_percentage']:.1f}%)")
         
         if self.json_diff_results:
-            diff_passed = sum(1 for r in self.json_diff_results if r['status'] == 'PASS')
+            diff_passed = Counter(r['status'] for r in self.json_diff_results)['PASS']
             diff_failed = len(self.json_diff_results) - diff_passed
             logger.info(f"\nJSON Diff (Java 8 vs Java 21):")
             logger.success(f"  ✓ Passed: {diff_passed}")
@@ -1784,6 +1850,7 @@ class TestOrchestrator:
         self.print_final_summary()
         
         # Cleanup
+        self.api_executor.shutdown()
         if self.mongo_client:
             self.mongo_client.close()
         
@@ -62,7 +62,7 @@ The `[]` notation is just for documentation in your mapping config. In actual Mo
 
 ### **Fix the aggregation_builder.py**
 
-Update the `build_pipeline` method to handle array notation:
+Update the `build_pipeline` method to handle array notation (add `import functools` at the top of the module, and add `Tuple` to the `typing` import - `from typing import List, Dict, Any, Set, Tuple`):
 
 ```python
 def build_pipeline(
@@ -95,63 +95,94 @@ def build_pipeline(
         cleaned_field = field.replace('[]', '')
         uncovered_fields.append(cleaned_field)
     
-    logger.debug(f"Building aggregation for {len(uncovered_fields)} uncovered fields")
-    logger.debug(f"Sample cleaned fields: {uncovered_fields[:3]}")
+    logger.debug("Building aggregation for %d uncovered fields", len(uncovered_fields))
+    logger.debug("Sample cleaned fields: %s", uncovered_fields[:3])
     
+    # Everything but the $limit stage only depends on the field list, so
+    # repeated calls with the same uncovered set reuse the already-built
+    # stages. The stage dicts are shared (PyMongo only reads them); each
+    # caller gets its own list with its own $limit stage
+    pipeline = list(_build_pipeline_template(self.payment_id_field, tuple(uncovered_fields)))
+    pipeline[_LIMIT_STAGE] = {'$limit': limit}
+    return pipeline
+```
+
+And add this below the class (a module-level cache, keyed by hashable arguments only, doesn't keep builder instances alive):
+
+```python
+# Position of the $limit stage, the only one that depends on the limit
+_LIMIT_STAGE = 4
+
+
+@functools.lru_cache(maxsize=32)
+def _build_pipeline_template(
+    payment_id_field: str,
+    uncovered_fields: Tuple[str, ...]
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the aggregation pipeline stages for a tuple of cleaned field names
+    
+    Args:
+        payment_id_field: MongoDB field name for payment ID
+        uncovered_fields: Cleaned MongoDB field names (no [] notation)
+    
+    Returns:
+        MongoDB aggregation pipeline stages, with a placeholder $limit stage
+        at _LIMIT_STAGE for build_pipeline to replace (cached - read-only)
+    """
     # Build $or conditions for $match stage
     match_conditions = []
     for field in uncovered_fields:
         match_conditions.append({
             field: {
                 '$exists': True,
-                '$ne': None,
-                '$ne': ""
+                '$nin': [None, ""]
             }
         })
     
-    # Build expressions to count how many uncovered fields each document has
-    count_expressions = []
-    for field in uncovered_fields:
-        field_ref = self._get_field_reference(field)
-        count_expressions.append({
-            '$cond': [
-                {
+    # Build expression to count how many uncovered fields each document has:
+    # a single $filter over the list of field references, instead of one
+    # $cond per field summed with $add
+    field_refs = ['$' + field for field in uncovered_fields]
+    count_expression = {
+        '$size': {
+            '$filter': {
+                'input': field_refs,
+                'as': 'v',
+                'cond': {
                     '$and': [
-                        {'$ne': [field_ref, None]},
-                        {'$ne': [field_ref, ""]},
-                        {'$ne': [field_ref, []]}
+                        {'$ne': ['$$v', None]},
+                        {'$ne': ['$$v', ""]},
+                        {'$ne': ['$$v', []]}
                     ]
-                },
-                1,
-                0
-            ]
-        })
-    
-    # Build projection to include all fields we need
-    # Group fields by their top-level parent
-    top_level_objects = set()
-    for field in uncovered_fields:
-        if '.' in field:
-            top_level = field.split('.')[0]
-            top_level_objects.add(top_level)
-        else:
-            # Non-nested field
-            top_level_objects.add(field)
+                }
+            }
+        }
+    }
     
-    # Build project stage
+    # Build project stage: instead of shipping whole subdocuments (MIFMP,
+    # MsgFees, ...) back to Python, return one boolean per uncovered field
+    # (same order as uncovered_fields) saying whether the record has data
     project_fields = {
-        self.payment_id_field: 1,
-        'uncoveredFieldCount': 1
+        payment_id_field: 1,
+        'uncoveredFieldCount': 1,
+        'covers': {
+            '$map': {
+                'input': field_refs,
+                'as': 'v',
+                'in': {
+                    '$and': [
+                        {'$ne': ['$$v', None]},
+                        {'$ne': ['$$v', ""]},
+                        {'$ne': ['$$v', []]}
+                    ]
+                }
+            }
+        }
     }
     
-    # Include all top-level objects
-    for top_level in top_level_objects:
-        project_fields[top_level] = 1
-    
-    logger.debug(f"Will project these top-level objects: {list(top_level_objects)}")
-    
     # Build the pipeline
-    pipeline = [
+    pipeline = (
         # Stage 1: Match records with ANY uncovered field
         {
             '$match': {
@@ -162,9 +193,7 @@ def build_pipeline(
         # Stage 2: Add field counting
         {
             '$addFields': {
-                'uncoveredFieldCount': {
-                    '$add': count_expressions
-                }
+                'uncoveredFieldCount': count_expression
             }
         },
         
@@ -176,24 +205,25 @@ def build_pipeline(
         },
         
         # Stage 4: Sort by count (descending)
+        # $sort must be immediately followed by $limit so MongoDB can
+        # coalesce them into a bounded top-K sort instead of sorting
+        # every matched document
         {
             '$sort': {
                 'uncoveredFieldCount': -1
             }
         },
         
-        # Stage 5: Limit to top candidates
+        # Stage 5: Limit to top candidates (set per call by build_pipeline)
         {
-            '$limit': limit
+            '$limit': None
         },
         
-        # Stage 6: Project the fields we need
+        # Stage 6: Project the fields we need (must stay AFTER $limit)
         {
             '$project': project_fields
         }
-    ]
-    
-    logger.debug(f"Pipeline stages: {len(pipeline)}")
+    )
     
     return pipeline
 ```
@@ -222,7 +252,9 @@ def select_optimal_records(
     Returns:
         Dict with selected payment IDs and coverage info
     """
-    # Clean field names (remove [] notation)
+    # Clean field names (remove [] notation), keeping build_pipeline's order
+    # so the server-side 'covers' array lines up with the fields
+    pipeline_fields = [m['mongoField'].replace('[]', '') for m in uncovered_mappings]
     uncovered_fields_original = set(m['mongoField'] for m in uncovered_mappings)
     uncovered_fields_cleaned = set()
     field_mapping = {}  # Map cleaned field → original field
@@ -235,81 +267,131 @@ def select_optimal_records(
     covered_fields: Set[str] = set()
     selected_records = []
     
-    logger.debug(f"Selecting optimal records from {len(aggregation_results)} candidates")
-    logger.debug(f"Total uncovered fields to find: {len(uncovered_fields_cleaned)}")
+    logger.debug("Selecting optimal records from %d candidates", len(aggregation_results))
+    logger.debug("Total uncovered fields to find: %d", len(uncovered_fields_cleaned))
     
-    # DEBUG: Show structure of first record
-    if len(aggregation_results) > 0:
+    # DEBUG: Show structure of first record (debug mode only - this
+    # introspection is not needed for selection itself)
+    if logger.debug_mode and len(aggregation_results) > 0:
         first_record = aggregation_results[0]
         logger.info("\n🔍 DEBUG: Inspecting first candidate record structure...")
         logger.info(f"  Top-level keys: {list(first_record.keys())}")
         
-        # Check for common parent objects
-        for obj_name in ['MIFMP', 'MsgFees', 'MessageRates', 'Msgerr']:
-            if obj_name in first_record:
-                obj_type = type(first_record[obj_name]).__name__
-                logger.info(f"  ✓ {obj_name} exists and is type: {obj_type}")
+        if 'covers' in first_record:
+            # Coverage was computed server-side; subdocuments are not projected
+            covers_found = sum(1 for present in first_record['covers'] if present)
+            logger.info(f"  Server-side covers: {covers_found}/{len(first_record['covers'])} fields have data")
+        else:
+            # Check for common parent objects
+            for obj_name in ['MIFMP', 'MsgFees', 'MessageRates', 'Msgerr']:
+                if obj_name in first_record:
+                    obj_type = type(first_record[obj_name]).__name__
+                    logger.info(f"  ✓ {obj_name} exists and is type: {obj_type}")
                 
-                if isinstance(first_record[obj_name], dict):
-                    logger.info(f"    {obj_name} sub-keys (first 5): {list(first_record[obj_name].keys())[:5]}")
-                elif isinstance(first_record[obj_name], list) and len(first_record[obj_name]) > 0:
-                    logger.info(f"    {obj_name} is array with {len(first_record[obj_name])} items")
-                    if isinstance(first_record[obj_name][0], dict):
-                        logger.info(f"    First item keys: {list(first_record[obj_name][0].keys())[:5]}")
-            else:
-                logger.warn(f"  ✗ {obj_name} not found in record")
+                    if isinstance(first_record[obj_name], dict):
+                        logger.info(f"    {obj_name} sub-keys (first 5): {list(first_record[obj_name].keys())[:5]}")
+                    elif isinstance(first_record[obj_name], list) and len(first_record[obj_name]) > 0:
+                        logger.info(f"    {obj_name} is array with {len(first_record[obj_name])} items")
+                        if isinstance(first_record[obj_name][0], dict):
+                            logger.info(f"    First item keys: {list(first_record[obj_name][0].keys())[:5]}")
+                else:
+                    logger.warn(f"  ✗ {obj_name} not found in record")
         
-        # Test accessing a few uncovered fields
-        test_fields = list(uncovered_fields_cleaned)[:3]
-        logger.info(f"\n  Testing access to {len(test_fields)} sample uncovered fields:")
-        for field in test_fields:
-            value = self._get_field_from_record(first_record, field)
-            original_field = field_mapping.get(field, field)
-            if value is not None and value != "" and value != []:
-                logger.success(f"    ✓ {original_field} (as {field}): {value}")
-            else:
-                logger.warn(f"    ✗ {original_field} (as {field}): {value} (empty or None)")
-    
-    # Now do the actual selection using CLEANED field names
+            # Test accessing a few uncovered fields
+            test_fields = list(uncovered_fields_cleaned)[:3]
+            logger.info(f"\n  Testing access to {len(test_fields)} sample uncovered fields:")
+            for field in test_fields:
+                value = self._get_field_from_record(first_record, field)
+                original_field = field_mapping.get(field, field)
+                if value not in _EMPTY_VALUES:
+                    logger.success(f"    ✓ {original_field} (as {field}): {value}")
+                else:
+                    logger.warn(f"    ✗ {original_field} (as {field}): {value} (empty or None)")
+    
+    # Split each field path once, not once per record
+    self._field_parts: Dict[str, Tuple[str, ...]] = {
+        f: tuple(f.split('.')) for f in pipeline_fields
+    }
+    
+    # Give each field a bit position so coverage sets become int bitmasks
+    field_list = list(self._field_parts)
+    field_bits = {f: bit for bit, f in enumerate(field_list)}
+    pipeline_bits = [field_bits[f] for f in pipeline_fields]
+    
+    # Group fields by top-level key (MIFMP, MsgFees, ...) so each record's
+    # subdocument is looked up once and absent subdocuments skip the group
+    fields_by_root: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {}
+    for bit, cleaned_field in enumerate(field_list):
+        parts = self._field_parts[cleaned_field]
+        fields_by_root.setdefault(parts[0], []).append((bit, parts[1:]))
+    
+    # Compute, once per record, the bitmask of uncovered fields it has data for
+    covers: List[int] = []
     for idx, record in enumerate(aggregation_results):
-        new_fields = []
-        fields_checked = 0
-        fields_found = 0
+        record_mask = 0
+        server_covers = record.get('covers')
         
-        for cleaned_field in uncovered_fields_cleaned:
-            if cleaned_field not in covered_fields:
-                fields_checked += 1
-                value = self._get_field_from_record(record, cleaned_field)
+        if server_covers is not None:
+            # Presence already evaluated by the pipeline's final $project
+            for bit, present in zip(pipeline_bits, server_covers):
+                if present:
+                    record_mask |= 1 << bit
+        else:
+            for root, root_fields in fields_by_root.items():
+                subdoc = record.get(root)
+                if subdoc is None:
+                    continue
                 
-                if value is not None and value != "" and value != []:
-                    new_fields.append(cleaned_field)
-                    fields_found += 1
+                for bit, tail in root_fields:
+                    value = self._get_field_from_parts(subdoc, tail)
+                    
+                    if value not in _EMPTY_VALUES:
+                        record_mask |= 1 << bit
         
-        if idx < 3:
-            logger.debug(f"\n  Record {idx}: Checked {fields_checked} fields, found {fields_found} with data")
+        covers.append(record_mask)
         
-        if new_fields:
-            payment_id = self._get_field_from_record(record, self.payment_id_field)
-            
-            if payment_id:
-                # Convert back to original field names for reporting
-                original_new_fields = [field_mapping.get(f, f) for f in new_fields]
-                
-                selected_records.append({
-                    'paymentId': payment_id,
-                    'coversFields': original_new_fields,  # Use original names
-                    'totalUncoveredFields': record.get('uncoveredFieldCount', len(new_fields))
-                })
-                
-                covered_fields.update(new_fields)
-                
-                logger.info(f"  ✓ Selected {payment_id}: covers {len(new_fields)} new fields")
-                if idx < 3:
-                    logger.debug(f"    Fields: {original_new_fields[:5]}{'...' if len(original_new_fields) > 5 else ''}")
+        if idx < 3 and logger.debug_mode:
+            logger.debug("\n  Record %d: Checked %d fields, found %d with data", idx, len(field_list), _popcount(record_mask))
+    
+    # Greedy set cover: repeatedly pick the record that covers the most
+    # still-uncovered fields (ties go to the earlier, higher-ranked record)
+    remaining = (1 << len(field_list)) - 1
+    candidates = list(range(len(aggregation_results)))
+    
+    while remaining:
+        # Drop records with nothing left to add, so each pass scans fewer
+        candidates = [i for i in candidates if covers[i] & remaining]
         
-        if len(covered_fields) == len(uncovered_fields_cleaned):
-            logger.debug("  All uncovered fields now have coverage candidates")
+        if not candidates:
             break
+        
+        idx = max(candidates, key=lambda i: _popcount(covers[i] & remaining))
+        new_mask = covers[idx] & remaining
+        candidates.remove(idx)
+        record = aggregation_results[idx]
+        payment_id = self._get_field_from_record(record, self.payment_id_field)
+        
+        if payment_id:
+            new_fields = [f for bit, f in enumerate(field_list) if new_mask >> bit & 1]
+            
+            # Convert back to original field names for reporting
+            original_new_fields = [field_mapping.get(f, f) for f in new_fields]
+            
+            selected_records.append({
+                'paymentId': payment_id,
+                'coversFields': original_new_fields,  # Use original names
+                'totalUncoveredFields': record.get('uncoveredFieldCount', len(new_fields))
+            })
+            
+            covered_fields.update(new_fields)
+            remaining &= ~new_mask
+            
+            logger.info(f"  ✓ Selected {payment_id}: covers {len(new_fields)} new fields")
+            if logger.debug_mode:
+                logger.debug("    Fields: %s%s", original_new_fields[:5], '...' if len(original_new_fields) > 5 else '')
+    
+    if not remaining:
+        logger.debug("  All uncovered fields now have coverage candidates")
     
     still_uncovered = uncovered_fields_cleaned - covered_fields
     still_uncovered_original = [field_mapping.get(f, f) for f in still_uncovered]
@@ -328,6 +410,15 @@ def select_optimal_records(
         'stillUncoveredCount': len(still_uncovered),
         'stillUncoveredFields': still_uncovered_original  # Use original names
     }
+
+
+# Values that count as "no data" for a field (0 and False are real data)
+_EMPTY_VALUES = (None, "", [])
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits in a coverage bitmask"""
+    return bin(mask).count('1')
 ```
 
 ---
@@ -350,13 +441,27 @@ def _get_field_from_record(self, record: Dict[str, Any], field_path: str) -> Any
     if not record or not field_path:
         return None
     
-    parts = field_path.split('.')
+    # Fast path for top-level fields such as the payment ID (_id)
+    if '.' not in field_path:
+        return record.get(field_path) if isinstance(record, dict) else None
+    
+    return self._get_field_from_parts(record, tuple(field_path.split('.')))
+
+
+def _get_field_from_parts(self, record: Dict[str, Any], parts: Tuple[str, ...]) -> Any:
+    """
+    Get field value from record using a pre-split field path
+    
+    Args:
+        record: MongoDB record
+        parts: Field path already split on '.' (e.g., ("MIFMP", "DbAccNo"))
+    
+    Returns:
+        Field value or None
+    """
     current = record
     
-    for i, part in enumerate(parts):
-        if current is None:
-            return None
-        
+    for part in parts:
         # If current is an array, access the first element
         if isinstance(current, list):
             if len(current) == 0:
@@ -364,12 +469,9 @@ def _get_field_from_record(self, record: Dict[str, Any], field_path: str) -> Any
             current = current[0]  # Take first element
         
         # Now access the key
-        if isinstance(current, dict):
-            if part in current:
-                current = current[part]
-            else:
-                return None
-        else:
+        current = current.get(part) if isinstance(current, dict) else None
+        
+        if current is None:
             return None
     
     return current